@@ -0,0 +1,66 @@
+"""Measure insert throughput of cache classes when every insert evicts.
+
+Each cache is filled to its maximum size, and then new keys are added,
+so every insertion discards an item to make space.  The best time per
+insertion over several runs is reported for each class.
+
+Usage: python benchmarks/eviction.py [CLASS...]
+
+"""
+
+import math
+import sys
+import time
+
+import cachetools
+
+CLASSES = (
+    "FIFOCache",
+    "LFUCache",
+    "LRUCache",
+    "RRCache",
+    "ARCCache",
+    "ClockCache",
+    "S3FIFOCache",
+    "SieveCache",
+    "SLRUCache",
+    "TwoQueueCache",
+    "TinyLFUCache",
+    "LIRSCache",
+    "GDSFCache",
+    "LRUKCache",
+    "SampledLRUCache",
+    "HyperbolicCache",
+    "SetAssociativeCache",
+    "TTLCache",
+    "TLRUCache",
+)
+
+
+def factory(name):
+    cls = getattr(cachetools, name)
+    if name == "TTLCache":
+        return lambda maxsize: cls(maxsize, ttl=math.inf)
+    if name == "TLRUCache":
+        return lambda maxsize: cls(maxsize, ttu=lambda k, v, t: math.inf)
+    return cls
+
+
+def evictions(name, maxsize=1000, inserts=100_000, repeat=5):
+    make = factory(name)
+    timings = []
+    for _ in range(repeat):
+        cache = make(maxsize)
+        for key in range(maxsize):
+            cache[key] = None
+        start = time.perf_counter()
+        for key in range(maxsize, maxsize + inserts):
+            cache[key] = None
+        timings.append(time.perf_counter() - start)
+    return min(timings) / inserts
+
+
+if __name__ == "__main__":
+    print("%-20s %10s" % ("class", "ns/insert"))
+    for name in sys.argv[1:] or CLASSES:
+        print("%-20s %10.1f" % (name, evictions(name) * 1e9))
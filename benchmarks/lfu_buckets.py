@@ -0,0 +1,50 @@
+"""Compare memory usage of LFUCache frequency buckets.
+
+LFUCache keeps the keys of each frequency bucket in an insertion
+ordered dict instead of a set, so equally frequently used items can be
+evicted in least recently used order.  This script compares the memory
+used by both container types for typical bucket sizes, as well as the
+memory used by an LFUCache with a realistic distribution of use counts.
+
+Usage: python benchmarks/lfu_buckets.py
+
+"""
+
+import random
+import sys
+import tracemalloc
+
+from cachetools import LFUCache
+
+
+def bucket_sizes():
+    print("%8s %8s %8s" % ("keys", "set", "dict"))
+    for n in (0, 1, 2, 4, 8, 16, 64, 256, 1024, 4096):
+        keys = [object() for _ in range(n)]
+        print(
+            "%8d %8d %8d"
+            % (n, sys.getsizeof(set(keys)), sys.getsizeof(dict.fromkeys(keys)))
+        )
+
+
+def cache_size(maxsize=10_000, accesses=1_000_000, seed=42):
+    rng = random.Random(seed)
+    tracemalloc.start()
+    cache = LFUCache(maxsize)
+    for _ in range(accesses):
+        key = int(rng.paretovariate(0.5))
+        try:
+            cache[key]
+        except KeyError:
+            cache[key] = None
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        "LFUCache(%d) with %d items: %d bytes, %.1f bytes per item"
+        % (maxsize, len(cache), current, current / len(cache))
+    )
+
+
+if __name__ == "__main__":
+    bucket_sizes()
+    cache_size()
@@ -0,0 +1,57 @@
+"""Compare the cost of cache hits for LRUCache with and without a buffer.
+
+With the optional `buffer` argument, looking up a key in an LRUCache
+does not reorder items, so a function decorated with @cached and a
+`lock` serves cache hits without acquiring the lock at all.  This
+script calls such a function for a small set of hot keys, so that
+almost every call is a cache hit, from one or more threads at once,
+and reports the best time per call over several runs.
+
+Usage: python benchmarks/lru_buffer.py [THREADS...]
+
+"""
+
+import sys
+import threading
+import time
+
+from cachetools import LRUCache, cached
+
+BUFFER = (None, 16, 256)
+
+
+def bench(buffer, info, threads, calls=200_000, hot=100, repeat=5):
+    @cached(LRUCache(1000, buffer=buffer), lock=threading.Lock(), info=info)
+    def func(n):
+        return n
+
+    keys = [n % hot for n in range(calls)]
+    for key in range(hot):
+        func(key)
+
+    def run():
+        for key in keys:
+            func(key)
+
+    timings = []
+    for _ in range(repeat):
+        workers = [threading.Thread(target=run) for _ in range(threads)]
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        timings.append(time.perf_counter() - start)
+    return min(timings) / (calls * threads) * 1e9
+
+
+def main(threads=(1, 4)):
+    print("%8s %8s %7s %10s" % ("buffer", "info", "threads", "ns/hit"))
+    for n in threads:
+        for buffer in BUFFER:
+            for info in (False, True):
+                print("%8s %8s %7d %10.1f" % (buffer, info, n, bench(buffer, info, n)))
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (1, 4))
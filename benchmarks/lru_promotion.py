@@ -0,0 +1,73 @@
+"""Compare hit ratio and throughput of LRUCache with lazy promotion.
+
+With the optional `lazy` argument, LRUCache does not move items that
+are already among the given fraction of most recently used items on
+access.  This script measures the hit ratio and the time per access
+for a Zipf-like workload, as well as the time per hit for a small set
+of hot keys, for several values of `lazy`.  Since items are moved
+less often, lazy promotion mainly reduces the number of writes to the
+cache's internal order on cache hits, which is also reported.
+
+Usage: python benchmarks/lru_promotion.py
+
+"""
+
+import random
+import time
+
+from cachetools import LRUCache
+
+LAZY = (None, 0.1, 0.25, 0.5, 0.75)
+
+
+def workload(accesses, keys, alpha=0.9, seed=42):
+    rng = random.Random(seed)
+    weights = [1 / (n + 1) ** alpha for n in range(keys)]
+    return rng.choices(range(keys), weights, k=accesses)
+
+
+def hit_ratio(maxsize=10_000, accesses=1_000_000, keys=1_000_000):
+    trace = workload(accesses, keys)
+    print("%8s %10s %10s" % ("lazy", "hit ratio", "ns/access"))
+    for lazy in LAZY:
+        cache = LRUCache(maxsize, lazy=lazy)
+        hits = 0
+        start = time.perf_counter()
+        for key in trace:
+            try:
+                cache[key]
+                hits += 1
+            except KeyError:
+                cache[key] = None
+        elapsed = time.perf_counter() - start
+        print(
+            "%8s %10.4f %10.1f" % (lazy, hits / len(trace), elapsed / len(trace) * 1e9)
+        )
+
+
+def hot_hits(maxsize=1_000_000, hot=1000, accesses=1_000_000, repeat=5):
+    trace = workload(accesses, hot)
+    print("%8s %10s %10s" % ("lazy", "ns/hit", "moves"))
+    for lazy in LAZY:
+        cache = LRUCache(maxsize, lazy=lazy)
+        for key in range(maxsize):
+            cache[key] = None
+        tick = cache._LRUCache__tick
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for key in trace:
+                cache[key]
+            timings.append(time.perf_counter() - start)
+        if lazy is None:
+            moves = len(trace) * repeat
+        else:
+            moves = cache._LRUCache__tick - tick
+        print(
+            "%8s %10.1f %10d" % (lazy, min(timings) / len(trace) * 1e9, moves // repeat)
+        )
+
+
+if __name__ == "__main__":
+    hit_ratio()
+    hot_hits()
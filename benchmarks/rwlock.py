@@ -0,0 +1,58 @@
+"""Compare the cost of cache hits with an exclusive and a reader-writer lock.
+
+A function decorated with @cached is called for a small set of hot
+keys, so that almost every call is a cache hit, from one or more
+threads at once.  The best time per call over several runs is
+reported for a plain `threading.Lock` and for a `cachetools.RWLock`,
+with and without `info`.  Note that with the GIL, concurrent readers
+do not run in parallel, so the reader-writer lock mainly helps if
+looking up keys or computing values releases the GIL.
+
+Usage: python benchmarks/rwlock.py [THREADS...]
+
+"""
+
+import sys
+import threading
+import time
+
+from cachetools import RWLock, cached
+
+LOCKS = (("Lock", threading.Lock), ("RWLock", RWLock))
+
+
+def bench(lock, info, threads, calls=200_000, hot=100, repeat=5):
+    @cached({}, lock=lock(), info=info)
+    def func(n):
+        return n
+
+    keys = [n % hot for n in range(calls)]
+    for key in range(hot):
+        func(key)
+
+    def run():
+        for key in keys:
+            func(key)
+
+    timings = []
+    for _ in range(repeat):
+        workers = [threading.Thread(target=run) for _ in range(threads)]
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        timings.append(time.perf_counter() - start)
+    return min(timings) / (calls * threads) * 1e9
+
+
+def main(threads=(1, 4)):
+    print("%8s %8s %7s %10s" % ("lock", "info", "threads", "ns/hit"))
+    for n in threads:
+        for name, lock in LOCKS:
+            for info in (False, True):
+                print("%8s %8s %7d %10.1f" % (name, info, n, bench(lock, info, n)))
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (1, 4))
@@ -1,24 +1,43 @@
 """Extensible memoizing collections and decorators."""
 
 __all__ = (
+    "ARCCache",
     "Cache",
+    "ClockCache",
     "FIFOCache",
+    "GDSFCache",
+    "HyperbolicCache",
     "LFUCache",
+    "LIRSCache",
     "LRUCache",
+    "LRUKCache",
     "RRCache",
+    "RWLock",
+    "S3FIFOCache",
+    "SLRUCache",
+    "SampledLRUCache",
+    "SetAssociativeCache",
+    "ShardedCache",
+    "SieveCache",
     "TLRUCache",
     "TTLCache",
+    "TinyLFUCache",
+    "TwoQueueCache",
     "cached",
     "cachedmethod",
 )
 
 __version__ = "7.0.6"
 
+import array
 import collections
 import collections.abc
+import contextlib
 import functools
 import heapq
+import math
 import random
+import threading
 import time
 
 from . import keys
@@ -26,6 +45,8 @@ from . import keys
 # Typing stubs for this package are provided by typeshed:
 # https://github.com/python/typeshed/tree/main/stubs/cachetools
 
+_MISSING = object()  # marker for items not found by Cache._lookup()
+
 
 class _DefaultSize:
     """A minimal "fake" dict that returns a constant size 1 for any key."""
@@ -45,6 +66,45 @@ class _DefaultSize:
         pass
 
 
+class _Listener:
+    """Deliver removed items to a callback, in batches if nested."""
+
+    __slots__ = ("callback", "reasons", "items")
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.reasons = []
+        self.items = []
+
+    def __call__(self, reason):
+        self.reasons.append(reason)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.reasons.pop()
+        if not self.reasons:
+            self.flush()
+
+    def __reduce__(self):
+        return _Listener, (self.callback,)
+
+    def add(self, key, value, reason=None):
+        if reason is None:
+            reason = self.reasons[-1] if self.reasons else "explicit"
+        self.items.append((key, value, reason))
+        if not self.reasons:
+            self.flush()
+
+    def flush(self):
+        items = self.items
+        if items:
+            self.items = []
+            self.callback(items)
+
+
 class Cache(collections.abc.MutableMapping):
     """Mutable mapping to serve as a simple cache or cache base class."""
 
@@ -52,7 +112,9 @@ class Cache(collections.abc.MutableMapping):
 
     __size = _DefaultSize()
 
-    def __init__(self, maxsize, getsizeof=None):
+    __listener = None
+
+    def __init__(self, maxsize, getsizeof=None, low_watermark=None, on_evict=None):
         if getsizeof:
             self.getsizeof = getsizeof
         if self.getsizeof is not Cache.getsizeof:
@@ -60,6 +122,31 @@ class Cache(collections.abc.MutableMapping):
         self.__data = dict()
         self.__currsize = 0
         self.__maxsize = maxsize
+        if low_watermark is None:
+            self.__low_watermark = maxsize
+        elif 0 <= low_watermark <= maxsize:
+            self.__low_watermark = low_watermark
+        else:
+            raise ValueError("low_watermark must be between 0 and maxsize")
+        if on_evict is None:
+            self.__listener = None
+        else:
+            self.__listener = _Listener(on_evict)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # derived classes overriding popitem() or __delitem__() rely on
+        # these being called when discarding items
+        if "_evict" not in cls.__dict__ and (
+            "popitem" in cls.__dict__ or "__delitem__" in cls.__dict__
+        ):
+            cls._evict = Cache._evict
+        # derived classes overriding __getitem__() or __missing__() rely
+        # on these being called when looking up items
+        if "_lookup" not in cls.__dict__ and (
+            "__getitem__" in cls.__dict__ or "__missing__" in cls.__dict__
+        ):
+            cls._lookup = Cache.__lookup
 
     def __repr__(self):
         return "%s(%s, maxsize=%r, currsize=%r)" % (
@@ -80,20 +167,37 @@ class Cache(collections.abc.MutableMapping):
         size = self.getsizeof(value)
         if size > maxsize:
             raise ValueError("value too large")
-        if key not in self.__data or self.__size[key] < size:
-            while self.__currsize + size > maxsize:
-                self.popitem()
-        if key in self.__data:
-            diffsize = size - self.__size[key]
-        else:
-            diffsize = size
-        self.__data[key] = value
-        self.__size[key] = size
-        self.__currsize += diffsize
+        listener = self.__listener
+        if listener is not None:
+            # report evicted and replaced items in one batch
+            listener.reasons.append("size")
+        try:
+            if key not in self.__data or self.__size[key] < size:
+                if self.__currsize + size > maxsize:
+                    # evict down to the low watermark in one batch, and
+                    # at least as much as required for the new item
+                    low_watermark = min(self.__low_watermark, maxsize - size)
+                    while self.__currsize > low_watermark:
+                        self._evict()
+            if key in self.__data:
+                diffsize = size - self.__size[key]
+                if listener is not None and self.__data[key] is not value:
+                    listener.add(key, self.__data[key], "replaced")
+            else:
+                diffsize = size
+            self.__data[key] = value
+            self.__size[key] = size
+            self.__currsize += diffsize
+        finally:
+            if listener is not None:
+                listener.__exit__()
 
     def __delitem__(self, key):
         size = self.__size.pop(key)
-        del self.__data[key]
+        if self.__listener is None:
+            del self.__data[key]
+        else:
+            self.__listener.add(key, self.__data.pop(key))
         self.__currsize -= size
 
     def __contains__(self, key):
@@ -137,6 +241,37 @@ class Cache(collections.abc.MutableMapping):
             self[key] = value = default
         return value
 
+    def get_many(self, keys):
+        """Return a dict of the given keys found in the cache and their
+        values.
+
+        """
+        return {key: self[key] for key in keys if key in self}
+
+    def set_many(self, mapping):
+        """Add all `(key, value)` pairs of the given mapping or iterable to
+        the cache.
+
+        """
+        if isinstance(mapping, collections.abc.Mapping):
+            mapping = mapping.items()
+        with self._evicting("size"):
+            for key, value in mapping:
+                self[key] = value
+
+    def delete_many(self, keys):
+        """Remove the given keys found in the cache and return the number
+        of items removed.
+
+        """
+        count = 0
+        with self._evicting("explicit"):
+            for key in keys:
+                if key in self:
+                    del self[key]
+                    count += 1
+        return count
+
     # Although the MutableMapping.clear() default implementation works
     # perfectly well, it calls popitem() in a loop until the cache is
     # empty, resulting in O(n) complexity.  For large caches, this
@@ -144,9 +279,69 @@ class Cache(collections.abc.MutableMapping):
     # optimized version for each Cache subclass.
 
     def clear(self):
+        listener = self.__listener
+        if listener is not None:
+            items = [(key, value, "explicit") for key, value in self.__data.items()]
         self.__data.clear()
         self.__size.clear()
         self.__currsize = 0
+        if listener is not None:
+            listener.items.extend(items)
+            if not listener.reasons:
+                listener.flush()
+
+    def _evict(self):
+        """Remove and return the `(key, value)` pair to be discarded to
+        make space for a new item.
+
+        Derived classes may override this with a faster version of
+        :meth:`popitem` that accesses their internal data structures
+        directly.
+
+        """
+        return self.popitem()
+
+    def _lookup(self, key, default=None):
+        """Return the value for `key` like ``self[key]``, but return
+        `default` instead of raising :exc:`KeyError` if not found.
+
+        Derived classes may override this with a version that probes
+        their internal data structures only once.
+
+        """
+        return self.__data.get(key, default)
+
+    def __lookup(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def _concurrent_lookup(self):
+        """Whether :meth:`_lookup` may be called by concurrent readers,
+        i.e. does not modify the cache.
+
+        """
+        return type(self)._lookup is Cache._lookup
+
+    @property
+    def _lockfree_lookup(self):
+        """Whether :meth:`_lookup` may be called without holding the lock
+        guarding the cache, which derived classes have to opt in to.
+
+        """
+        return False
+
+    def _evicting(self, reason):
+        """Return a context manager for removing items for the given
+        reason in one batch.
+
+        """
+        if self.__listener is None:
+            return contextlib.nullcontext()
+        else:
+            return self.__listener(reason)
 
     @property
     def maxsize(self):
@@ -158,6 +353,22 @@ class Cache(collections.abc.MutableMapping):
         """The current size of the cache."""
         return self.__currsize
 
+    @property
+    def on_evict(self):
+        """The function called with items removed from the cache, or
+        :const:`None`.
+
+        """
+        if self.__listener is None:
+            return None
+        else:
+            return self.__listener.callback
+
+    @property
+    def low_watermark(self):
+        """The size to which the cache is reduced when full."""
+        return self.__low_watermark
+
     @staticmethod
     def getsizeof(value):
         """Return the size of a cache element's value."""
@@ -167,8 +378,8 @@ class Cache(collections.abc.MutableMapping):
 class FIFOCache(Cache):
     """First In First Out (FIFO) cache implementation."""
 
-    def __init__(self, maxsize, getsizeof=None):
-        Cache.__init__(self, maxsize, getsizeof)
+    def __init__(self, maxsize, getsizeof=None, low_watermark=None, on_evict=None):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
         self.__order = collections.OrderedDict()
 
     def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
@@ -188,8 +399,18 @@ class FIFOCache(Cache):
             key = next(iter(self.__order))
         except StopIteration:
             raise KeyError("%s is empty" % type(self).__name__) from None
-        else:
-            return (key, self.pop(key))
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def _evict(self, cache_getitem=Cache.__getitem__, cache_delitem=Cache.__delitem__):
+        try:
+            key, _ = self.__order.popitem(last=False)
+        except KeyError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        value = cache_getitem(self, key)
+        cache_delitem(self, key)
+        return (key, value)
 
     def clear(self):
         Cache.clear(self)
@@ -200,11 +421,12 @@ class LFUCache(Cache):
     """Least Frequently Used (LFU) cache implementation."""
 
     class _Link:
-        __slots__ = ("count", "keys", "next", "prev")
+        __slots__ = ("count", "epoch", "keys", "next", "prev")
 
-        def __init__(self, count):
+        def __init__(self, count, epoch=0):
             self.count = count
-            self.keys = set()
+            self.epoch = epoch
+            self.keys = {}  # insertion order is least recently used first
 
         def unlink(self):
             next = self.next
@@ -212,11 +434,21 @@ class LFUCache(Cache):
             prev.next = next
             next.prev = prev
 
-    def __init__(self, maxsize, getsizeof=None):
-        Cache.__init__(self, maxsize, getsizeof)
+    def __init__(
+        self, maxsize, getsizeof=None, halflife=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
         self.__root = root = LFUCache._Link(0)  # sentinel
         root.prev = root.next = root
         self.__links = {}
+        self.__halflife = halflife
+        self.__accesses = 0
+        self.__epoch = 0
+
+    @property
+    def halflife(self):
+        """The number of accesses after which all use counts are halved."""
+        return self.__halflife
 
     def __getitem__(self, key, cache_getitem=Cache.__getitem__):
         value = cache_getitem(self, key)
@@ -224,123 +456,1770 @@ class LFUCache(Cache):
             self.__touch(key)
         return value
 
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__touch(key)
+        return value
+
     def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
         cache_setitem(self, key, value)
         if key in self.__links:
             self.__touch(key)
             return
+        if self.__halflife is not None:
+            self.__accesses += 1
+            if self.__accesses >= self.__halflife:
+                self.__accesses = 0
+                self.__epoch += 1
         root = self.__root
         link = root.next
+        if link is not root and link.epoch != self.__epoch:
+            self.__count(link)
         if link.count != 1:
-            link = LFUCache._Link(1)
+            link = LFUCache._Link(1, self.__epoch)
             link.next = root.next
             root.next = link.next.prev = link
             link.prev = root
-        link.keys.add(key)
+        link.keys[key] = None
         self.__links[key] = link
 
     def __delitem__(self, key, cache_delitem=Cache.__delitem__):
         cache_delitem(self, key)
-        link = self.__links.pop(key)
-        link.keys.remove(key)
-        if not link.keys:
-            link.unlink()
+        link = self.__links.pop(key)
+        del link.keys[key]
+        if not link.keys:
+            link.unlink()
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair least frequently used,
+        or least recently used among equally frequently used pairs.
+
+        """
+        root = self.__root
+        curr = root.next
+        if curr is root:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        key = next(iter(curr.keys))  # least recently used in bucket
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def _evict(self, cache_getitem=Cache.__getitem__, cache_delitem=Cache.__delitem__):
+        root = self.__root
+        curr = root.next
+        if curr is root:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        keys = curr.keys
+        key = next(iter(keys))
+        value = cache_getitem(self, key)
+        cache_delitem(self, key)
+        del self.__links[key]
+        del keys[key]
+        if not keys:
+            curr.unlink()
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        root = self.__root
+        root.prev = root.next = root
+        self.__links.clear()
+        self.__accesses = 0
+        self.__epoch = 0
+
+    def __count(self, link):
+        """Return a link's use count, halved once per epoch passed"""
+        epoch = self.__epoch
+        if link.epoch != epoch:
+            # halving preserves order, so links are updated lazily
+            link.count = max(link.count >> (epoch - link.epoch), 1)
+            link.epoch = epoch
+        return link.count
+
+    def __touch(self, key):
+        """Increment use count"""
+        if self.__halflife is not None:
+            return self.__touch_aging(key)
+        link = self.__links[key]
+        curr = link.next
+        if curr.count != link.count + 1:
+            if len(link.keys) == 1:
+                link.count += 1
+                return
+            curr = LFUCache._Link(link.count + 1)
+            curr.next = link.next
+            link.next = curr.next.prev = curr
+            curr.prev = link
+        curr.keys[key] = None
+        del link.keys[key]
+        if not link.keys:
+            link.unlink()
+        self.__links[key] = curr
+
+    def __touch_aging(self, key):
+        """Increment use count, halving all counts periodically"""
+        self.__accesses += 1
+        if self.__accesses >= self.__halflife:
+            self.__accesses = 0
+            self.__epoch += 1
+        epoch = self.__epoch
+        root = self.__root
+        link = self.__links[key]
+        count = self.__count(link) + 1
+        curr = link.next
+        # merge links whose counts have become equal after halving, so
+        # they are not rescanned on later accesses
+        while curr is not root and self.__count(curr) < count:
+            for k in curr.keys:
+                self.__links[k] = link
+            link.keys.update(curr.keys)
+            curr.unlink()
+            curr = curr.next
+        if curr is root or curr.count != count:
+            if len(link.keys) == 1 and curr is link.next:
+                link.count = count
+                return
+            prev = curr.prev
+            curr = LFUCache._Link(count, epoch)
+            curr.next = prev.next
+            prev.next = curr.next.prev = curr
+            curr.prev = prev
+        curr.keys[key] = None
+        del link.keys[key]
+        if not link.keys:
+            link.unlink()
+        self.__links[key] = curr
+
+
+class LRUCache(Cache):
+    """Least Recently Used (LRU) cache implementation."""
+
+    def __init__(
+        self,
+        maxsize,
+        getsizeof=None,
+        scan=None,
+        lazy=None,
+        buffer=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__order = collections.OrderedDict()  # key -> tick when last moved
+        self.__tick = 0
+        self.__scan = scan
+        self.__scans = 0
+        self.__misses = 0  # number of items added since last hit
+        self.__lazy = lazy
+        if buffer is None:
+            self.__buffer = None
+        else:
+            # appending to a deque is thread-safe, and discards the
+            # oldest keys once the buffer is full
+            self.__buffer = collections.deque(maxlen=buffer)
+
+    @property
+    def buffer(self):
+        """The maximum number of items whose moves on access are
+        deferred, or :const:`None`.
+
+        """
+        if self.__buffer is None:
+            return None
+        else:
+            return self.__buffer.maxlen
+
+    @property
+    def lazy(self):
+        """The fraction of most recently used items that are not moved on
+        access, or :const:`None`.
+
+        """
+        return self.__lazy
+
+    @property
+    def scan(self):
+        """The number of items added in a row that are assumed to be a
+        scan, or :const:`None`.
+
+        """
+        return self.__scan
+
+    @property
+    def scans(self):
+        """The number of scans detected by the cache."""
+        return self.__scans
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        if key in self:  # __missing__ may not store item
+            if self.__buffer is None:
+                self.__touch(key)
+            else:
+                self.__buffer.append(key)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        if self.__buffer is None:
+            self.__touch(key)
+        else:
+            self.__buffer.append(key)
+        return value
+
+    @property
+    def _concurrent_lookup(self):
+        return self.__buffer is not None and type(self)._lookup is LRUCache._lookup
+
+    @property
+    def _lockfree_lookup(self):
+        return self._concurrent_lookup
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        if self.__buffer:
+            self.__drain()
+        cache_setitem(self, key, value)
+        order = self.__order
+        self.__tick = tick = self.__tick + 1
+        try:
+            order.move_to_end(key)
+        except KeyError:
+            order[key] = tick
+            if self.__scan is not None:
+                self.__detect(key)
+        else:
+            order[key] = tick
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        del self.__order[key]
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair least recently used."""
+        if self.__buffer:
+            self.__drain()
+        try:
+            key = next(iter(self.__order))
+        except StopIteration:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        # bypass __getitem__(), which would count as a hit
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def _evict(self, cache_getitem=Cache.__getitem__, cache_delitem=Cache.__delitem__):
+        try:
+            key, _ = self.__order.popitem(last=False)
+        except KeyError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        value = cache_getitem(self, key)
+        cache_delitem(self, key)
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__order.clear()
+        self.__tick = 0
+        self.__scans = 0
+        self.__misses = 0
+        if self.__buffer is not None:
+            self.__buffer.clear()
+
+    def __drain(self):
+        """Move buffered items as if they were accessed now"""
+        buffer = self.__buffer
+        order = self.__order
+        # keys appended while draining are left for the next batch
+        for _ in range(len(buffer)):
+            key = buffer.popleft()
+            if key in order:  # item may have been removed since
+                self.__touch(key)
+
+    def __touch(self, key):
+        """Mark item as most recently used"""
+        lazy = self.__lazy
+        if lazy is None:
+            self.__order.move_to_end(key)
+        else:
+            # at most (tick - order[key]) items were moved since
+            order = self.__order
+            tick = self.__tick
+            if tick - order[key] >= lazy * len(order):
+                order.move_to_end(key)
+                self.__tick = order[key] = tick + 1
+        self.__misses = 0
+
+    def __detect(self, key):
+        """Mark new item as least recently used during a scan"""
+        self.__misses += 1
+        if self.__misses >= self.__scan:
+            if self.__misses == self.__scan:
+                self.__scans += 1
+            self.__order.move_to_end(key, last=False)
+            self.__order[key] = -math.inf  # always move on access
+
+
+class RRCache(Cache):
+    """Random Replacement (RR) cache implementation."""
+
+    def __init__(
+        self,
+        maxsize,
+        choice=random.choice,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__choice = choice
+        self.__index = {}
+        self.__keys = []
+
+    @property
+    def choice(self):
+        """The `choice` function used by the cache."""
+        return self.__choice
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        if key not in self.__index:
+            self.__index[key] = len(self.__keys)
+            self.__keys.append(key)
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        index = self.__index.pop(key)
+        if index != len(self.__keys) - 1:
+            last = self.__keys[-1]
+            self.__keys[index] = last
+            self.__index[last] = index
+        self.__keys.pop()
+
+    def popitem(self):
+        """Remove and return a random `(key, value)` pair."""
+        try:
+            key = self.__choice(self.__keys)
+        except IndexError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def _evict(self, cache_getitem=Cache.__getitem__, cache_delitem=Cache.__delitem__):
+        keys = self.__keys
+        try:
+            key = self.__choice(keys)
+        except IndexError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        value = cache_getitem(self, key)
+        cache_delitem(self, key)
+        index = self.__index.pop(key)
+        last = keys.pop()
+        if index != len(keys):
+            keys[index] = last
+            self.__index[last] = index
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__index.clear()
+        del self.__keys[:]
+
+
+class ARCCache(Cache):
+    """Adaptive Replacement Cache (ARC) implementation."""
+
+    def __init__(self, maxsize, getsizeof=None, low_watermark=None, on_evict=None):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__t1 = collections.OrderedDict()  # seen once, resident
+        self.__t2 = collections.OrderedDict()  # seen twice, resident
+        self.__b1 = collections.OrderedDict()  # evicted from t1, keys only
+        self.__b2 = collections.OrderedDict()  # evicted from t2, keys only
+        self.__p = 0  # target number of t1 items
+        self.__b2hit = False
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        if key in self:  # __missing__ may not store item
+            self.__touch(key)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__touch(key)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        b1 = self.__b1
+        b2 = self.__b2
+        if key in b1:
+            self.__p = min(self.__p + max(len(b2) // len(b1), 1), len(self))
+            del b1[key]
+            ghost = True
+        elif key in b2:
+            self.__p = max(self.__p - max(len(b1) // len(b2), 1), 0)
+            del b2[key]
+            ghost = self.__b2hit = True
+        else:
+            ghost = False
+        try:
+            cache_setitem(self, key, value)
+        finally:
+            self.__b2hit = False
+        if key in self.__t1 or key in self.__t2:
+            self.__touch(key)
+        else:
+            # key may have been evicted by cache_setitem() to make room
+            # for a larger value, so make sure it is no longer a ghost
+            b1.pop(key, None)
+            b2.pop(key, None)
+            if ghost:
+                self.__t2[key] = None
+            else:
+                self.__t1[key] = None
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        try:
+            del self.__t1[key]
+        except KeyError:
+            del self.__t2[key]
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair chosen by the adaptive
+        replacement policy.
+
+        """
+        t1 = self.__t1
+        t2 = self.__t2
+        if t1 and (
+            not t2 or len(t1) > self.__p or (self.__b2hit and len(t1) == self.__p)
+        ):
+            key = next(iter(t1))
+            ghosts = self.__b1
+        elif t2:
+            key = next(iter(t2))
+            ghosts = self.__b2
+        else:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        # bypass __getitem__(), which would count as a hit
+        item = (key, Cache.__getitem__(self, key))
+        del self[key]
+        ghosts[key] = None
+        # bound history to the number of items the cache can hold
+        b1 = self.__b1
+        b2 = self.__b2
+        size = len(self) + 1
+        while len(t1) + len(b1) > size:
+            b1.popitem(last=False)
+        while len(b1) + len(b2) > size:
+            b2.popitem(last=False)
+        return item
+
+    def clear(self):
+        Cache.clear(self)
+        self.__t1.clear()
+        self.__t2.clear()
+        self.__b1.clear()
+        self.__b2.clear()
+        self.__p = 0
+
+    def __touch(self, key):
+        """Mark as frequently used"""
+        try:
+            self.__t2.move_to_end(key)
+        except KeyError:
+            del self.__t1[key]
+            self.__t2[key] = None
+
+
+class TinyLFUCache(Cache):
+    """Window Tiny Least Frequently Used (W-TinyLFU) cache implementation."""
+
+    __MAXWIDTH = 1 << 24  # maximum number of counters per sketch row
+
+    class _Sketch:
+        """Count-min sketch with a doorkeeper and periodic aging."""
+
+        __slots__ = ("table", "doorkeeper", "mask", "additions", "samplesize")
+
+        # counters are saturated at 15, as if four bits were used
+        __MAXCOUNT = 15
+
+        # halving all counters at once using bytes.translate()
+        __HALVE = bytes(i >> 1 for i in range(256))
+
+        # multipliers for deriving one table index per row from hash(key)
+        __SEEDS = (
+            0x9E3779B97F4A7C15,
+            0xC2B2AE3D27D4EB4F,
+            0x165667B19E3779F9,
+            0xD6E8FEB86659FD93,
+        )
+
+        def __init__(self, width):
+            self.table = bytearray(len(self.__SEEDS) * width)
+            self.doorkeeper = bytearray(width)  # 8 * width bits
+            self.mask = width - 1
+            self.additions = 0
+            self.samplesize = 10 * width
+
+        def increment(self, key):
+            h = hash(key) & 0xFFFFFFFFFFFFFFFF
+            self.additions += 1
+            if self.__doorkeep(h):
+                table = self.table
+                indexes = self.__indexes(h)
+                count = min(table[i] for i in indexes)
+                if count < self.__MAXCOUNT:
+                    # conservative update: only increment minimal counters
+                    for i in indexes:
+                        if table[i] == count:
+                            table[i] = count + 1
+            if self.additions >= self.samplesize:
+                self.reset()
+
+        def frequency(self, key):
+            h = hash(key) & 0xFFFFFFFFFFFFFFFF
+            table = self.table
+            count = min(table[i] for i in self.__indexes(h))
+            doorkeeper = self.doorkeeper
+            for i in self.__bits(h):
+                if not doorkeeper[i >> 3] & (1 << (i & 7)):
+                    return count
+            return count + 1
+
+        def reset(self):
+            """Halve all counters and clear the doorkeeper"""
+            self.table[:] = self.table.translate(self.__HALVE)
+            self.doorkeeper[:] = bytes(len(self.doorkeeper))
+            self.additions //= 2
+
+        def clear(self):
+            self.table[:] = bytes(len(self.table))
+            self.doorkeeper[:] = bytes(len(self.doorkeeper))
+            self.additions = 0
+
+        def __doorkeep(self, h):
+            """Add hash to doorkeeper and return whether it was present"""
+            doorkeeper = self.doorkeeper
+            present = True
+            for i in self.__bits(h):
+                bit = 1 << (i & 7)
+                if not doorkeeper[i >> 3] & bit:
+                    doorkeeper[i >> 3] |= bit
+                    present = False
+            return present
+
+        def __bits(self, h):
+            h = (h * self.__SEEDS[0]) & 0xFFFFFFFFFFFFFFFF
+            mask = (self.mask << 3) | 7
+            return (h & mask, (h >> 32) & mask)
+
+        def __indexes(self, h):
+            mask = self.mask
+            width = mask + 1
+            return [
+                row * width + ((((h * seed) & 0xFFFFFFFFFFFFFFFF) >> 32) & mask)
+                for row, seed in enumerate(self.__SEEDS)
+            ]
+
+    def __init__(
+        self, maxsize, window=0.01, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        if self.getsizeof is Cache.getsizeof and math.isfinite(maxsize):
+            n = int(min(maxsize, TinyLFUCache.__MAXWIDTH))
+        else:
+            n = 1  # maxsize is not a number of items, grow as needed
+        self.__sketch = TinyLFUCache._Sketch(1 << max(n - 1, 15).bit_length())
+        self.__window = window
+        self.__windowed = collections.OrderedDict()
+        self.__main = collections.OrderedDict()
+
+    @property
+    def window(self):
+        """The fraction of items kept in the admission window."""
+        return self.__window
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        self.__sketch.increment(key)  # also record misses
+        value = cache_getitem(self, key)
+        if key in self:  # __missing__ may not store item
+            self.__touch(key)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        self.__sketch.increment(key)  # also record misses
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__touch(key)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        windowed = self.__windowed
+        if key in windowed or key in self.__main:
+            self.__touch(key)
+        else:
+            windowed[key] = None
+            sketch = self.__sketch
+            if len(self) > sketch.mask + 1 and sketch.mask < self.__MAXWIDTH - 1:
+                # like resizing a hash table, this loses all frequencies
+                width = 1 << (2 * len(self) - 1).bit_length()
+                self.__sketch = TinyLFUCache._Sketch(min(width, self.__MAXWIDTH))
+            # window overflow only happens while the cache is not full,
+            # so items are moved to the main cache without contest
+            limit = max(1, int(len(self) * self.__window))
+            while len(windowed) > limit:
+                self.__main[windowed.popitem(last=False)[0]] = None
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        try:
+            del self.__windowed[key]
+        except KeyError:
+            del self.__main[key]
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair least recently used
+        from the window or the main cache, whichever is estimated to be
+        used less frequently.
+
+        """
+        windowed = self.__windowed
+        main = self.__main
+        while True:
+            # the item about to be inserted will also take a window slot
+            if len(windowed) >= max(1, int(len(self) * self.__window)) or not main:
+                try:
+                    candidate = next(iter(windowed))
+                except StopIteration:
+                    raise KeyError("%s is empty" % type(self).__name__) from None
+                if not main:
+                    # admit candidate to main cache, no contest necessary
+                    del windowed[candidate]
+                    main[candidate] = None
+                    continue
+                victim = next(iter(main))
+                sketch = self.__sketch
+                if sketch.frequency(candidate) > sketch.frequency(victim):
+                    del windowed[candidate]
+                    main[candidate] = None
+                    key = victim
+                else:
+                    key = candidate
+            else:
+                key = next(iter(main))
+            # bypass __getitem__() so evictions are not counted as use
+            value = Cache.__getitem__(self, key)
+            del self[key]
+            return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__sketch.clear()
+        self.__windowed.clear()
+        self.__main.clear()
+
+    def __touch(self, key):
+        """Mark as recently used"""
+        try:
+            self.__windowed.move_to_end(key)
+        except KeyError:
+            self.__main.move_to_end(key)
+
+
+class SLRUCache(Cache):
+    """Segmented Least Recently Used (SLRU) cache implementation."""
+
+    def __init__(
+        self, maxsize, protected=0.8, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__protected = protected
+        self.__probation = collections.OrderedDict()
+        self.__protection = collections.OrderedDict()  # key -> size
+        self.__protsize = 0
+
+    @property
+    def protected(self):
+        """The fraction of `maxsize` reserved for the protected segment."""
+        return self.__protected
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        if key in self:  # __missing__ may not store item
+            self.__touch(key, value)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__touch(key, value)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        protection = self.__protection
+        if key in protection:
+            size = self.getsizeof(value)
+            self.__protsize += size - protection[key]
+            protection[key] = size
+            self.__touch(key, value)
+        elif key in self.__probation:
+            self.__touch(key, value)
+        else:
+            self.__probation[key] = None
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        try:
+            del self.__probation[key]
+        except KeyError:
+            self.__protsize -= self.__protection.pop(key)
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair least recently used
+        from the probationary segment, or from the protected segment if
+        there are no probationary items.
+
+        """
+        try:
+            key = next(iter(self.__probation or self.__protection))
+        except StopIteration:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        else:
+            # self.pop() would promote a probationary item, so bypass
+            # __getitem__() to not demote a protected one
+            value = Cache.__getitem__(self, key)
+            del self[key]
+            return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__probation.clear()
+        self.__protection.clear()
+        self.__protsize = 0
+
+    def __touch(self, key, value):
+        """Mark as recently used, promoting probationary items"""
+        protection = self.__protection
+        try:
+            protection.move_to_end(key)
+        except KeyError:
+            del self.__probation[key]
+            protection[key] = size = self.getsizeof(value)
+            self.__protsize += size
+        # demote overflowing protected items back to probation, but
+        # always keep the most recently used one
+        limit = self.maxsize * self.__protected
+        while self.__protsize > limit and len(protection) > 1:
+            key, size = protection.popitem(last=False)
+            self.__protsize -= size
+            self.__probation[key] = None
+
+
+class TwoQueueCache(Cache):
+    """2Q cache implementation."""
+
+    def __init__(
+        self,
+        maxsize,
+        kin=0.25,
+        kout=0.5,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__kin = kin
+        self.__kout = kout
+        self.__a1in = collections.OrderedDict()  # FIFO of new items -> size
+        self.__a1out = collections.OrderedDict()  # FIFO of evicted keys
+        self.__am = collections.OrderedDict()  # LRU of reused items
+        self.__a1insize = 0
+
+    @property
+    def kin(self):
+        """The fraction of `maxsize` reserved for new items."""
+        return self.__kin
+
+    @property
+    def kout(self):
+        """The number of evicted keys to remember, as a fraction of
+        `maxsize`, or of the number of items if `getsizeof` is given.
+
+        """
+        return self.__kout
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        try:
+            self.__am.move_to_end(key)
+        except KeyError:
+            pass  # new items are not reordered
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        try:
+            self.__am.move_to_end(key)
+        except KeyError:
+            pass  # new items are not reordered
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        am = self.__am
+        a1in = self.__a1in
+        if key in am:
+            am.move_to_end(key)
+        elif key in self.__a1out:
+            del self.__a1out[key]
+            am[key] = None
+        else:
+            size = self.getsizeof(value)
+            self.__a1insize += size - a1in.get(key, 0)
+            a1in[key] = size
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        try:
+            self.__a1insize -= self.__a1in.pop(key)
+        except KeyError:
+            del self.__am[key]
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair first inserted if
+        there are enough new items, or the `(key, value)` pair least
+        recently used otherwise.
+
+        """
+        a1in = self.__a1in
+        limit = self.maxsize * self.__kin
+        if (len(a1in) > 1 and self.__a1insize > limit) or not self.__am:
+            try:
+                key = next(iter(a1in))
+            except StopIteration:
+                raise KeyError("%s is empty" % type(self).__name__) from None
+            # bypass __getitem__(), which would count as a hit
+            item = (key, Cache.__getitem__(self, key))
+            del self[key]
+            a1out = self.__a1out
+            a1out[key] = None
+            if self.getsizeof is Cache.getsizeof:
+                limit = self.maxsize * self.__kout
+            else:
+                # evicted keys hold no size, so count resident items
+                limit = (len(self) + 1) * self.__kout
+            while len(a1out) > max(1, limit):
+                a1out.popitem(last=False)
+            return item
+        else:
+            key = next(iter(self.__am))
+            item = (key, Cache.__getitem__(self, key))
+            del self[key]
+            return item
+
+    def clear(self):
+        Cache.clear(self)
+        self.__a1in.clear()
+        self.__a1out.clear()
+        self.__am.clear()
+        self.__a1insize = 0
+
+
+class ClockCache(Cache):
+    """CLOCK (second chance) cache implementation."""
+
+    class _Empty:
+        pass  # empty slot marker, a class preserves identity when pickling
+
+    def __init__(self, maxsize, getsizeof=None, low_watermark=None, on_evict=None):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__index = {}
+        self.__keys = []
+        self.__refs = bytearray()
+        self.__free = []
+        self.__hand = 0
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        try:
+            self.__refs[self.__index[key]] = 1
+        except KeyError:
+            pass  # __missing__ may not store item
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__refs[self.__index[key]] = 1
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        try:
+            self.__refs[self.__index[key]] = 1
+        except KeyError:
+            if self.__free:
+                # reuse the slot of an evicted item, i.e. behind the hand
+                index = self.__free.pop()
+                self.__keys[index] = key
+                self.__refs[index] = 0
+            else:
+                index = len(self.__keys)
+                self.__keys.append(key)
+                self.__refs.append(0)
+            self.__index[key] = index
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        index = self.__index.pop(key)
+        self.__keys[index] = ClockCache._Empty
+        self.__free.append(index)
+
+    def popitem(self):
+        """Remove and return the next `(key, value)` pair not recently used
+        after the clock hand.
+
+        """
+        if not self.__index:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        keys = self.__keys
+        refs = self.__refs
+        size = len(keys)
+        hand = self.__hand
+        while True:
+            if hand >= size:
+                hand = 0
+            key = keys[hand]
+            if key is ClockCache._Empty:
+                pass
+            elif refs[hand]:
+                refs[hand] = 0  # second chance
+            else:
+                break
+            hand += 1
+        self.__hand = hand + 1
+        # bypass __getitem__(), which would set the reference bit
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__index.clear()
+        del self.__keys[:]
+        del self.__refs[:]
+        del self.__free[:]
+        self.__hand = 0
+
+
+class S3FIFOCache(Cache):
+    """S3-FIFO cache implementation."""
+
+    __MAXFREQ = 3
+
+    def __init__(
+        self, maxsize, small=0.1, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__small = small
+        # map keys to their access frequency, in insertion order
+        self.__smallq = collections.OrderedDict()
+        self.__mainq = collections.OrderedDict()
+        self.__ghostq = collections.OrderedDict()  # evicted keys only
+        self.__smallsizes = {}  # sizes of items in the small queue
+        self.__smallsize = 0
+
+    @property
+    def small(self):
+        """The fraction of `maxsize` reserved for the small queue."""
+        return self.__small
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        self.__hit(key)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__hit(key)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        if key in self.__smallq:
+            size = self.getsizeof(value)
+            self.__smallsize += size - self.__smallsizes[key]
+            self.__smallsizes[key] = size
+            self.__hit(key)
+        elif key in self.__mainq:
+            self.__hit(key)
+        elif key in self.__ghostq:
+            del self.__ghostq[key]
+            self.__mainq[key] = 0
+        else:
+            self.__smallq[key] = 0
+            self.__smallsizes[key] = size = self.getsizeof(value)
+            self.__smallsize += size
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        try:
+            del self.__smallq[key]
+        except KeyError:
+            del self.__mainq[key]
+        else:
+            self.__smallsize -= self.__smallsizes.pop(key)
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair first inserted that
+        has not been used since.
+
+        """
+        smallq = self.__smallq
+        mainq = self.__mainq
+        while True:
+            limit = self.maxsize * self.__small
+            if (smallq and self.__smallsize >= limit) or not mainq:
+                try:
+                    key = next(iter(smallq))
+                except StopIteration:
+                    raise KeyError("%s is empty" % type(self).__name__) from None
+                if smallq[key]:
+                    # promote items used at least once to the main queue
+                    del smallq[key]
+                    self.__smallsize -= self.__smallsizes.pop(key)
+                    mainq[key] = 0
+                    continue
+                # bypass __getitem__(), which would count as a use
+                item = (key, Cache.__getitem__(self, key))
+                del self[key]
+                ghostq = self.__ghostq
+                ghostq[key] = None
+                if len(ghostq) > max(1, len(self)):
+                    ghostq.popitem(last=False)
+                return item
+            else:
+                key = next(iter(mainq))
+                freq = mainq[key]
+                if freq:
+                    # reinsert at the end with decremented frequency
+                    del mainq[key]
+                    mainq[key] = freq - 1
+                    continue
+                item = (key, Cache.__getitem__(self, key))
+                del self[key]
+                return item
+
+    def clear(self):
+        Cache.clear(self)
+        self.__smallq.clear()
+        self.__mainq.clear()
+        self.__ghostq.clear()
+        self.__smallsizes.clear()
+        self.__smallsize = 0
+
+    def __hit(self, key):
+        """Increment access frequency"""
+        queue = self.__smallq if key in self.__smallq else self.__mainq
+        try:
+            freq = queue[key]
+        except KeyError:
+            pass  # __missing__ may not store item
+        else:
+            if freq < self.__MAXFREQ:
+                queue[key] = freq + 1
+
+
+class SieveCache(Cache):
+    """SIEVE cache implementation."""
+
+    class _Link:
+        __slots__ = ("key", "visited", "next", "prev")
+
+        def __init__(self, key=None, visited=False):
+            self.key = key
+            self.visited = visited
+
+        def __reduce__(self):
+            return SieveCache._Link, (self.key, self.visited)
+
+        def unlink(self):
+            next = self.next
+            prev = self.prev
+            prev.next = next
+            next.prev = prev
+
+    def __init__(self, maxsize, getsizeof=None, low_watermark=None, on_evict=None):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__root = root = SieveCache._Link()
+        root.prev = root.next = root
+        self.__links = {}  # insertion order is queue order
+        self.__hand = root
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        try:
+            self.__links[key].visited = True
+        except KeyError:
+            pass  # __missing__ may not store item
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__links[key].visited = True
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        try:
+            self.__links[key].visited = True
+        except KeyError:
+            self.__links[key] = link = SieveCache._Link(key)
+            link.next = root = self.__root
+            link.prev = prev = root.prev
+            prev.next = root.prev = link
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        link = self.__links.pop(key)
+        if link is self.__hand:
+            self.__hand = link.next
+        link.unlink()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        root = self.__root
+        root.prev = root.next = root
+        for link in self.__links.values():
+            link.next = root
+            link.prev = prev = root.prev
+            prev.next = root.prev = link
+
+    def popitem(self):
+        """Remove and return the next `(key, value)` pair not visited
+        after the hand, moving from first to last inserted.
+
+        """
+        root = self.__root
+        if root.next is root:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        hand = self.__hand
+        while hand is root or hand.visited:
+            if hand is not root:
+                hand.visited = False
+            hand = hand.next
+        self.__hand = hand.next
+        key = hand.key
+        # bypass __getitem__(), which would mark the item as visited
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        root = self.__root
+        root.prev = root.next = root
+        self.__links.clear()
+        self.__hand = root
+
+
+class LIRSCache(Cache):
+    """Low Inter-reference Recency Set (LIRS) cache implementation."""
+
+    def __init__(
+        self, maxsize, hirs=0.01, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__hirs = hirs
+        if self.getsizeof is Cache.getsizeof and math.isfinite(maxsize):
+            self.__lirsize = max(1, maxsize - max(1, maxsize * hirs))
+        else:
+            self.__lirsize = None  # maxsize is not a number of items
+        self.__stack = collections.OrderedDict()  # recency stack S
+        self.__queue = collections.OrderedDict()  # resident HIR items Q
+        self.__lir = set()
+        self.__ghosts = collections.OrderedDict()  # non-resident HIR keys
+
+    @property
+    def hirs(self):
+        """The fraction of items reserved for resident HIR items."""
+        return self.__hirs
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        if key in self:
+            value = cache_getitem(self, key)
+            self.__touch(key)
+            return value
+        else:
+            return self.__missing__(key)
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__touch(key)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        stack = self.__stack
+        if key in self.__lir or key in self.__queue:
+            self.__touch(key)
+        elif len(self.__lir) < self.__getlirsize():
+            stack.pop(key, None)
+            self.__ghosts.pop(key, None)
+            stack[key] = None
+            self.__lir.add(key)
+        elif key in stack:
+            # non-resident HIR item with low inter-reference recency
+            del self.__ghosts[key]
+            stack.move_to_end(key)
+            self.__lir.add(key)
+            self.__demote()
+        else:
+            stack[key] = None
+            self.__queue[key] = None
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        try:
+            self.__lir.remove(key)
+        except KeyError:
+            del self.__queue[key]
+            self.__stack.pop(key, None)
+        else:
+            del self.__stack[key]
+            self.__prune()
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair first inserted into
+        the resident HIR queue, or the LIR pair least recently used if
+        there are no resident HIR items.
+
+        """
+        queue = self.__queue
+        stack = self.__stack
+        # remove items directly, since self.pop() would count as use
+        if queue:
+            key = next(iter(queue))
+            value = Cache.__getitem__(self, key)
+            Cache.__delitem__(self, key)
+            del queue[key]
+            if key in stack:
+                ghosts = self.__ghosts
+                ghosts[key] = None
+                while len(ghosts) > max(1, len(self)):
+                    del stack[ghosts.popitem(last=False)[0]]
+        elif stack:
+            key = next(iter(stack))
+            value = Cache.__getitem__(self, key)
+            Cache.__delitem__(self, key)
+            self.__lir.remove(key)
+            del stack[key]
+            self.__prune()
+        else:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__stack.clear()
+        self.__queue.clear()
+        self.__lir.clear()
+        self.__ghosts.clear()
+
+    def __touch(self, key):
+        """Mark as recently used"""
+        stack = self.__stack
+        if key in self.__lir:
+            stack.move_to_end(key)
+            self.__prune()
+        elif len(self.__lir) < self.__getlirsize():
+            # resident HIR item, promoted while there is room for LIR items
+            stack.pop(key, None)
+            stack[key] = None
+            del self.__queue[key]
+            self.__lir.add(key)
+        elif key in stack:
+            # resident HIR item with low inter-reference recency
+            stack.move_to_end(key)
+            del self.__queue[key]
+            self.__lir.add(key)
+            self.__demote()
+        else:
+            stack[key] = None
+            self.__queue.move_to_end(key)
+
+    def __getlirsize(self):
+        """Return the maximum number of LIR items"""
+        if self.__lirsize is not None:
+            return self.__lirsize
+        else:
+            return max(1, len(self) - max(1, len(self) * self.__hirs))
+
+    def __demote(self):
+        """Demote the bottom LIR item to a resident HIR item"""
+        key, _ = self.__stack.popitem(last=False)
+        self.__lir.remove(key)
+        self.__queue[key] = None
+        self.__prune()
+
+    def __prune(self):
+        """Remove HIR items from the bottom of the stack"""
+        stack = self.__stack
+        lir = self.__lir
+        ghosts = self.__ghosts
+        while stack:
+            key = next(iter(stack))
+            if key in lir:
+                break
+            del stack[key]
+            ghosts.pop(key, None)
+
+
+class GDSFCache(Cache):
+    """Greedy Dual Size Frequency (GDSF) cache implementation."""
+
+    __HEAP_CLEANUP_FACTOR = 2  # clean up the heap if size > N * len(items)
+
+    @functools.total_ordering
+    class _Item:
+        __slots__ = ("key", "priority", "freq", "cost", "size", "removed")
+
+        def __init__(self, key, priority, freq, cost, size):
+            self.key = key
+            self.priority = priority
+            self.freq = freq
+            self.cost = cost
+            self.size = size
+            self.removed = False
+
+        def __lt__(self, other):
+            return self.priority < other.priority
+
+    def __init__(
+        self, maxsize, getcost=None, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        if getcost:
+            self.getcost = getcost
+        self.__items = {}
+        self.__order = []
+        self.__clock = 0
+
+    @property
+    def clock(self):
+        """The priority of the last item discarded from the cache."""
+        return self.__clock
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        try:
+            item = self.__items[key]
+        except KeyError:
+            pass  # __missing__ may not store item
+        else:
+            self.__push(key, item.freq + 1, item.cost, item.size)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        item = self.__items[key]
+        self.__push(key, item.freq + 1, item.cost, item.size)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        try:
+            freq = self.__items[key].freq + 1
+        except KeyError:
+            freq = 1
+        cost = self.getcost(key, value)
+        self.__push(key, freq, cost, self.getsizeof(value))
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        self.__items.pop(key).removed = True
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair with the lowest
+        priority.
+
+        """
+        order = self.__order
+        while order and order[0].removed:
+            heapq.heappop(order)
+        try:
+            item = heapq.heappop(order)
+        except IndexError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        self.__clock = item.priority
+        # bypass __getitem__(), which would update the item's priority
+        value = Cache.__getitem__(self, item.key)
+        del self[item.key]
+        return (item.key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__items.clear()
+        del self.__order[:]
+        self.__clock = 0
+
+    @staticmethod
+    def getcost(key, value):
+        """Return the cost of computing a cache element's value."""
+        return 1
+
+    def __push(self, key, freq, cost, size):
+        """Update an item's priority"""
+        items = self.__items
+        try:
+            items[key].removed = True
+        except KeyError:
+            pass
+        if size:
+            priority = self.__clock + freq * cost / size
+        else:
+            priority = float("inf")
+        order = self.__order
+        # clean up the heap if too many items are marked as removed
+        if len(order) > len(items) * self.__HEAP_CLEANUP_FACTOR:
+            self.__order = order = [obj for obj in order if not obj.removed]
+            heapq.heapify(order)
+        items[key] = item = GDSFCache._Item(key, priority, freq, cost, size)
+        heapq.heappush(order, item)
+
+
+class LRUKCache(Cache):
+    """LRU-K cache implementation."""
+
+    __HEAP_CLEANUP_FACTOR = 2  # clean up the heap if size > N * len(items)
+
+    @functools.total_ordering
+    class _Item:
+        __slots__ = ("key", "priority", "removed")
+
+        def __init__(self, key, priority):
+            self.key = key
+            self.priority = priority
+            self.removed = False
+
+        def __lt__(self, other):
+            return self.priority < other.priority
+
+    def __init__(
+        self,
+        maxsize,
+        k=2,
+        timer=None,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__k = k
+        self.__timer = timer
+        self.__time = 0  # logical clock if no timer is given
+        self.__refs = {}  # last k reference times of cached items
+        self.__items = {}
+        self.__order = []
+        self.__history = collections.OrderedDict()  # of evicted items
+
+    @property
+    def k(self):
+        """The number of references considered by the cache."""
+        return self.__k
+
+    @property
+    def timer(self):
+        """The timer function used by the cache, or :const:`None`."""
+        return self.__timer
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        if key in self:
+            value = cache_getitem(self, key)
+            self.__reference(key)
+            return value
+        else:
+            return self.__missing__(key)
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__reference(key)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        cache_setitem(self, key, value)
+        if key not in self.__refs:
+            self.__refs[key] = self.__history.pop(key, [])
+        self.__reference(key)
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        del self.__refs[key]
+        self.__items.pop(key).removed = True
 
     def popitem(self):
-        """Remove and return the `(key, value)` pair least frequently used."""
-        root = self.__root
-        curr = root.next
-        if curr is root:
+        """Remove and return the `(key, value)` pair whose k-th most recent
+        reference is oldest, or the pair least recently used among those
+        referenced less than k times.
+
+        """
+        order = self.__order
+        while order and order[0].removed:
+            heapq.heappop(order)
+        try:
+            key = heapq.heappop(order).key
+        except IndexError:
             raise KeyError("%s is empty" % type(self).__name__) from None
-        key = next(iter(curr.keys))  # remove an arbitrary element
-        return (key, self.pop(key))
+        refs = self.__refs[key]
+        # bypass __getitem__(), which would count as a reference
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        # remember reference times in case the key is added again soon
+        history = self.__history
+        history[key] = refs
+        while len(history) > max(1, len(self)):
+            history.popitem(last=False)
+        return (key, value)
 
     def clear(self):
         Cache.clear(self)
-        root = self.__root
-        root.prev = root.next = root
-        self.__links.clear()
-
-    def __touch(self, key):
-        """Increment use count"""
-        link = self.__links[key]
-        curr = link.next
-        if curr.count != link.count + 1:
-            if len(link.keys) == 1:
-                link.count += 1
-                return
-            curr = LFUCache._Link(link.count + 1)
-            curr.next = link.next
-            link.next = curr.next.prev = curr
-            curr.prev = link
-        curr.keys.add(key)
-        link.keys.remove(key)
-        if not link.keys:
-            link.unlink()
-        self.__links[key] = curr
+        self.__time = 0
+        self.__refs.clear()
+        self.__items.clear()
+        del self.__order[:]
+        self.__history.clear()
 
+    def __reference(self, key):
+        """Record reference time"""
+        if self.__timer is None:
+            self.__time = time = self.__time + 1
+        else:
+            time = self.__timer()
+        refs = self.__refs[key]
+        refs.append(time)
+        if len(refs) > self.__k:
+            del refs[0]
+        items = self.__items
+        try:
+            items[key].removed = True
+        except KeyError:
+            pass
+        if len(refs) < self.__k:
+            priority = (0, time)  # evict first, least recently used
+        else:
+            priority = (1, refs[0])
+        order = self.__order
+        # clean up the heap if too many items are marked as removed
+        if len(order) > len(items) * self.__HEAP_CLEANUP_FACTOR:
+            self.__order = order = [obj for obj in order if not obj.removed]
+            heapq.heapify(order)
+        items[key] = item = LRUKCache._Item(key, priority)
+        heapq.heappush(order, item)
+
+
+class SampledLRUCache(Cache):
+    """Sampled approximate Least Recently Used (LRU) cache implementation."""
+
+    def __init__(
+        self,
+        maxsize,
+        samples=5,
+        choice=random.choice,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__samples = samples
+        self.__choice = choice
+        self.__index = {}
+        self.__keys = []
+        self.__ticks = array.array("Q")  # last access, parallel to keys
+        self.__tick = 0
 
-class LRUCache(Cache):
-    """Least Recently Used (LRU) cache implementation."""
+    @property
+    def samples(self):
+        """The number of items sampled for eviction."""
+        return self.__samples
 
-    def __init__(self, maxsize, getsizeof=None):
-        Cache.__init__(self, maxsize, getsizeof)
-        self.__order = collections.OrderedDict()
+    @property
+    def choice(self):
+        """The `choice` function used by the cache."""
+        return self.__choice
 
     def __getitem__(self, key, cache_getitem=Cache.__getitem__):
         value = cache_getitem(self, key)
         if key in self:  # __missing__ may not store item
-            self.__touch(key)
+            self.__tick += 1
+            self.__ticks[self.__index[key]] = self.__tick
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__tick += 1
+        self.__ticks[self.__index[key]] = self.__tick
         return value
 
     def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
         cache_setitem(self, key, value)
-        self.__touch(key)
+        self.__tick += 1
+        try:
+            self.__ticks[self.__index[key]] = self.__tick
+        except KeyError:
+            self.__index[key] = len(self.__keys)
+            self.__keys.append(key)
+            self.__ticks.append(self.__tick)
 
     def __delitem__(self, key, cache_delitem=Cache.__delitem__):
         cache_delitem(self, key)
-        del self.__order[key]
+        index = self.__index.pop(key)
+        if index != len(self.__keys) - 1:
+            last = self.__keys[-1]
+            self.__keys[index] = last
+            self.__ticks[index] = self.__ticks[-1]
+            self.__index[last] = index
+        self.__keys.pop()
+        self.__ticks.pop()
 
     def popitem(self):
-        """Remove and return the `(key, value)` pair least recently used."""
+        """Remove and return the `(key, value)` pair least recently used
+        among a random sample of items.
+
+        """
+        choice = self.__choice
+        keys = self.__keys
+        index = self.__index
+        ticks = self.__ticks
         try:
-            key = next(iter(self.__order))
-        except StopIteration:
+            key = choice(keys)
+        except IndexError:
             raise KeyError("%s is empty" % type(self).__name__) from None
-        else:
-            return (key, self.pop(key))
+        tick = ticks[index[key]]
+        for _ in range(self.__samples - 1):
+            k = choice(keys)
+            t = ticks[index[k]]
+            if t < tick:
+                key, tick = k, t
+        # bypass __getitem__(), which would update the access tick
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
 
     def clear(self):
         Cache.clear(self)
-        self.__order.clear()
-
-    def __touch(self, key):
-        """Mark as recently used"""
-        try:
-            self.__order.move_to_end(key)
-        except KeyError:
-            self.__order[key] = None
+        self.__index.clear()
+        del self.__keys[:]
+        del self.__ticks[:]
+        self.__tick = 0
 
 
-class RRCache(Cache):
-    """Random Replacement (RR) cache implementation."""
+class HyperbolicCache(Cache):
+    """Hyperbolic cache implementation."""
 
-    def __init__(self, maxsize, choice=random.choice, getsizeof=None):
-        Cache.__init__(self, maxsize, getsizeof)
+    class _Item:
+        __slots__ = ("hits", "since", "cost")
+
+        def __init__(self, since, cost):
+            self.hits = 1
+            self.since = since
+            self.cost = cost
+
+    def __init__(
+        self,
+        maxsize,
+        samples=5,
+        choice=random.choice,
+        timer=None,
+        getcost=None,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        if getcost:
+            self.getcost = getcost
+        self.__samples = samples
         self.__choice = choice
+        self.__timer = timer
+        self.__time = 0  # logical clock if no timer is given
         self.__index = {}
         self.__keys = []
+        self.__items = []  # parallel to keys
+
+    @property
+    def samples(self):
+        """The number of items sampled for eviction."""
+        return self.__samples
 
     @property
     def choice(self):
         """The `choice` function used by the cache."""
         return self.__choice
 
+    @property
+    def timer(self):
+        """The timer function used by the cache, or :const:`None`."""
+        return self.__timer
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        if key in self:  # __missing__ may not store item
+            if self.__timer is None:
+                self.__time += 1
+            self.__items[self.__index[key]].hits += 1
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        if self.__timer is None:
+            self.__time += 1
+        self.__items[self.__index[key]].hits += 1
+        return value
+
     def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
         cache_setitem(self, key, value)
-        if key not in self.__index:
+        if self.__timer is None:
+            self.__time += 1
+        cost = self.getcost(key, value)
+        try:
+            item = self.__items[self.__index[key]]
+        except KeyError:
             self.__index[key] = len(self.__keys)
             self.__keys.append(key)
+            self.__items.append(HyperbolicCache._Item(self.__now(), cost))
+        else:
+            item.hits += 1
+            item.cost = cost
 
     def __delitem__(self, key, cache_delitem=Cache.__delitem__):
         cache_delitem(self, key)
@@ -348,22 +2227,146 @@ class RRCache(Cache):
         if index != len(self.__keys) - 1:
             last = self.__keys[-1]
             self.__keys[index] = last
+            self.__items[index] = self.__items[-1]
             self.__index[last] = index
         self.__keys.pop()
+        self.__items.pop()
 
     def popitem(self):
-        """Remove and return a random `(key, value)` pair."""
+        """Remove and return the `(key, value)` pair with the lowest
+        number of hits per time in cache, weighted by cost, among a
+        random sample of items.
+
+        """
+        choice = self.__choice
+        keys = self.__keys
         try:
-            key = self.__choice(self.__keys)
+            key = choice(keys)
         except IndexError:
             raise KeyError("%s is empty" % type(self).__name__) from None
-        else:
-            return (key, self.pop(key))
+        now = self.__now()
+        priority = self.__priority(key, now)
+        for _ in range(self.__samples - 1):
+            k = choice(keys)
+            p = self.__priority(k, now)
+            if p < priority:
+                key, priority = k, p
+        # bypass __getitem__(), which would count as a hit
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
 
     def clear(self):
         Cache.clear(self)
+        self.__time = 0
         self.__index.clear()
         del self.__keys[:]
+        del self.__items[:]
+
+    @staticmethod
+    def getcost(key, value):
+        """Return the cost of computing a cache element's value."""
+        return 1
+
+    def __now(self):
+        """Return current time"""
+        if self.__timer is None:
+            return self.__time
+        else:
+            return self.__timer()
+
+    def __priority(self, key, now):
+        """Return hits per time in cache, weighted by cost"""
+        item = self.__items[self.__index[key]]
+        elapsed = now - item.since
+        if elapsed > 0:
+            return item.hits * item.cost / elapsed
+        else:
+            return float("inf")  # give new items a chance
+
+
+class SetAssociativeCache(Cache):
+    """Set-associative cache implementation."""
+
+    def __init__(
+        self, maxsize, ways=8, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
+        self.__ways = ways
+        if math.isfinite(maxsize):
+            self.__nsets = max(1, int(maxsize // ways))
+            self.__limit = ways
+        else:
+            self.__nsets = 1
+            self.__limit = maxsize
+        self.__sets = {}  # non-empty sets, in order of eviction
+
+    @property
+    def ways(self):
+        """The maximum number of items in each set."""
+        return self.__ways
+
+    def __getitem__(self, key, cache_getitem=Cache.__getitem__):
+        value = cache_getitem(self, key)
+        if key in self:  # __missing__ may not store item
+            self.__sets[hash(key) % self.__nsets].move_to_end(key)
+        return value
+
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        value = cache_lookup(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.__sets[hash(key) % self.__nsets].move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
+        if self.getsizeof(value) > self.maxsize:
+            raise ValueError("value too large")
+        index = hash(key) % self.__nsets
+        ways = self.__sets.get(index)
+        if ways is not None and key not in ways and len(ways) >= self.__limit:
+            # evict from this set first, so that the cache as a whole
+            # never overflows and evicts from some other set as well
+            with self._evicting("size"):
+                del self[next(iter(ways))]
+        cache_setitem(self, key, value)
+        try:
+            ways = self.__sets[index]
+        except KeyError:
+            ways = self.__sets[index] = collections.OrderedDict()
+        try:
+            ways.move_to_end(key)
+        except KeyError:
+            ways[key] = None
+
+    def __delitem__(self, key, cache_delitem=Cache.__delitem__):
+        cache_delitem(self, key)
+        index = hash(key) % self.__nsets
+        ways = self.__sets[index]
+        del ways[key]
+        if not ways:
+            del self.__sets[index]
+
+    def popitem(self):
+        """Remove and return the `(key, value)` pair least recently used
+        from the next set in turn.
+
+        """
+        sets = self.__sets
+        try:
+            index = next(iter(sets))
+        except StopIteration:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        sets[index] = ways = sets.pop(index)  # rotate
+        key = next(iter(ways))
+        # bypass __getitem__(), which would mark the item as used
+        value = Cache.__getitem__(self, key)
+        del self[key]
+        return (key, value)
+
+    def clear(self):
+        Cache.clear(self)
+        self.__sets.clear()
 
 
 class _TimedCache(Cache):
@@ -397,8 +2400,10 @@ class _TimedCache(Cache):
         def __getattr__(self, name):
             return getattr(self.__timer, name)
 
-    def __init__(self, maxsize, timer, getsizeof=None):
-        Cache.__init__(self, maxsize, getsizeof)
+    def __init__(
+        self, maxsize, timer, getsizeof=None, low_watermark=None, on_evict=None
+    ):
+        Cache.__init__(self, maxsize, getsizeof, low_watermark, on_evict)
         self.__timer = _TimedCache._Timer(timer)
 
     def __repr__(self, cache_repr=Cache.__repr__):
@@ -434,6 +2439,21 @@ class _TimedCache(Cache):
         with self.__timer:
             return Cache.setdefault(self, *args, **kwargs)
 
+    def get_many(self, keys):
+        with self.__timer as time:
+            self.expire(time)
+            return Cache.get_many(self, keys)
+
+    def set_many(self, mapping):
+        with self.__timer as time:
+            self.expire(time)
+            Cache.set_many(self, mapping)
+
+    def delete_many(self, keys):
+        with self.__timer as time:
+            self.expire(time)
+            return Cache.delete_many(self, keys)
+
     def clear(self):
         # Subclasses must override to also reset their own time-tracking
         # structures; we do not call expire() here since clear() should
@@ -460,8 +2480,16 @@ class TTLCache(_TimedCache):
             prev.next = next
             next.prev = prev
 
-    def __init__(self, maxsize, ttl, timer=time.monotonic, getsizeof=None):
-        _TimedCache.__init__(self, maxsize, timer, getsizeof)
+    def __init__(
+        self,
+        maxsize,
+        ttl,
+        timer=time.monotonic,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        _TimedCache.__init__(self, maxsize, timer, getsizeof, low_watermark, on_evict)
         self.__root = root = TTLCache._Link()
         root.prev = root.next = root
         self.__links = collections.OrderedDict()
@@ -487,6 +2515,15 @@ class TTLCache(_TimedCache):
         else:
             return cache_getitem(self, key)
 
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        link = self.__links.get(key)
+        if link is None:
+            return default
+        self.__links.move_to_end(key)
+        if not (self.timer() < link.expires):
+            return default
+        return cache_lookup(self, key, default)
+
     def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
         with self.timer as time:
             self.expire(time)
@@ -545,15 +2582,18 @@ class TTLCache(_TimedCache):
         curr = root.next
         links = self.__links
         expired = []
+        if curr is root or time < curr.expires:
+            return expired
         cache_delitem = Cache.__delitem__
         cache_getitem = Cache.__getitem__
-        while curr is not root and not (time < curr.expires):
-            expired.append((curr.key, cache_getitem(self, curr.key)))
-            cache_delitem(self, curr.key)
-            del links[curr.key]
-            next = curr.next
-            curr.unlink()
-            curr = next
+        with self._evicting("expired"):
+            while curr is not root and not (time < curr.expires):
+                expired.append((curr.key, cache_getitem(self, curr.key)))
+                cache_delitem(self, curr.key)
+                del links[curr.key]
+                next = curr.next
+                curr.unlink()
+                curr = next
         return expired
 
     def popitem(self):
@@ -567,8 +2607,20 @@ class TTLCache(_TimedCache):
                 key = next(iter(self.__links))
             except StopIteration:
                 raise KeyError("%s is empty" % type(self).__name__) from None
-            else:
-                return (key, self.pop(key))
+            value = Cache.__getitem__(self, key)
+            del self[key]
+            return (key, value)
+
+    def _evict(self, cache_getitem=Cache.__getitem__, cache_delitem=Cache.__delitem__):
+        # expired items have already been removed by __setitem__()
+        try:
+            key, link = self.__links.popitem(last=False)
+        except KeyError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        value = cache_getitem(self, key)
+        cache_delitem(self, key)
+        link.unlink()
+        return (key, value)
 
     def clear(self):
         _TimedCache.clear(self)
@@ -599,8 +2651,16 @@ class TLRUCache(_TimedCache):
         def __lt__(self, other):
             return self.expires < other.expires
 
-    def __init__(self, maxsize, ttu, timer=time.monotonic, getsizeof=None):
-        _TimedCache.__init__(self, maxsize, timer, getsizeof)
+    def __init__(
+        self,
+        maxsize,
+        ttu,
+        timer=time.monotonic,
+        getsizeof=None,
+        low_watermark=None,
+        on_evict=None,
+    ):
+        _TimedCache.__init__(self, maxsize, timer, getsizeof, low_watermark, on_evict)
         self.__items = collections.OrderedDict()
         self.__order = []
         self.__ttu = ttu
@@ -625,6 +2685,15 @@ class TLRUCache(_TimedCache):
         else:
             return cache_getitem(self, key)
 
+    def _lookup(self, key, default=None, cache_lookup=Cache._lookup):
+        item = self.__items.get(key)
+        if item is None:
+            return default
+        self.__items.move_to_end(key)
+        if not (self.timer() < item.expires):
+            return default
+        return cache_lookup(self, key, default)
+
     def __setitem__(self, key, value, cache_setitem=Cache.__setitem__):
         with self.timer as time:
             expires = self.__ttu(key, value, time)
@@ -678,12 +2747,17 @@ class TLRUCache(_TimedCache):
         expired = []
         cache_delitem = Cache.__delitem__
         cache_getitem = Cache.__getitem__
-        while order and (order[0].removed or not (time < order[0].expires)):
-            item = heapq.heappop(order)
-            if not item.removed:
-                expired.append((item.key, cache_getitem(self, item.key)))
-                cache_delitem(self, item.key)
-                del items[item.key]
+        while order and order[0].removed:
+            heapq.heappop(order)
+        if not order or time < order[0].expires:
+            return expired
+        with self._evicting("expired"):
+            while order and (order[0].removed or not (time < order[0].expires)):
+                item = heapq.heappop(order)
+                if not item.removed:
+                    expired.append((item.key, cache_getitem(self, item.key)))
+                    cache_delitem(self, item.key)
+                    del items[item.key]
         return expired
 
     def popitem(self):
@@ -697,8 +2771,20 @@ class TLRUCache(_TimedCache):
                 key = next(iter(self.__items))
             except StopIteration:
                 raise KeyError("%s is empty" % type(self).__name__) from None
-            else:
-                return (key, self.pop(key))
+            value = Cache.__getitem__(self, key)
+            del self[key]
+            return (key, value)
+
+    def _evict(self, cache_getitem=Cache.__getitem__, cache_delitem=Cache.__delitem__):
+        # expired items have already been removed by __setitem__()
+        try:
+            key, item = self.__items.popitem(last=False)
+        except KeyError:
+            raise KeyError("%s is empty" % type(self).__name__) from None
+        value = cache_getitem(self, key)
+        cache_delitem(self, key)
+        item.removed = True
+        return (key, value)
 
     def clear(self):
         _TimedCache.clear(self)
@@ -711,6 +2797,212 @@ class TLRUCache(_TimedCache):
         return value
 
 
+class ShardedCache(collections.abc.MutableMapping):
+    """Thread-safe cache partitioning keys across several independent
+    caches, each guarded by its own lock.
+
+    """
+
+    def __init__(self, maxsize, shards=16, factory=LRUCache):
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        if shards > maxsize:
+            # each shard should be able to hold at least one item
+            shards = max(int(maxsize), 1)
+        if math.isfinite(maxsize):
+            size, rest = divmod(maxsize, shards)
+            sizes = [size + (i < rest) for i in range(shards)]
+        else:
+            sizes = [maxsize] * shards
+        self.__shards = tuple(factory(size) for size in sizes)
+        self.__locks = tuple(threading.RLock() for _ in sizes)
+
+    def __repr__(self):
+        return "%s(shards=%r, maxsize=%r, currsize=%r)" % (
+            type(self).__name__,
+            len(self.__shards),
+            self.maxsize,
+            self.currsize,
+        )
+
+    def __getitem__(self, key):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            return self.__shards[index][key]
+
+    def __setitem__(self, key, value):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            self.__shards[index][key] = value
+
+    def __delitem__(self, key):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            del self.__shards[index][key]
+
+    def __contains__(self, key):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            return key in self.__shards[index]
+
+    def __iter__(self):
+        for shard, lock in zip(self.__shards, self.__locks):
+            with lock:
+                keys = list(shard)
+            yield from keys
+
+    def __len__(self):
+        total = 0
+        for shard, lock in zip(self.__shards, self.__locks):
+            with lock:
+                total += len(shard)
+        return total
+
+    def get(self, key, default=None):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            return self.__shards[index].get(key, default)
+
+    def pop(self, key, *args):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            return self.__shards[index].pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            return self.__shards[index].setdefault(key, default)
+
+    def popitem(self):
+        """Remove and return a `(key, value)` pair from the first
+        non-empty shard.
+
+        """
+        for shard, lock in zip(self.__shards, self.__locks):
+            with lock:
+                if shard:
+                    return shard.popitem()
+        raise KeyError("%s is empty" % type(self).__name__)
+
+    def clear(self):
+        for shard, lock in zip(self.__shards, self.__locks):
+            with lock:
+                shard.clear()
+
+    def _lookup(self, key, default=None):
+        index = hash(key) % len(self.__shards)
+        with self.__locks[index]:
+            return self.__shards[index]._lookup(key, default)
+
+    @property
+    def maxsize(self):
+        """The maximum size of the cache, summed over all shards."""
+        return sum(shard.maxsize for shard in self.__shards)
+
+    @property
+    def currsize(self):
+        """The current size of the cache, summed over all shards."""
+        total = 0
+        for shard, lock in zip(self.__shards, self.__locks):
+            with lock:
+                total += shard.currsize
+        return total
+
+    @property
+    def shards(self):
+        """The caches holding the items, indexed by `hash(key) % len(shards)`."""
+        return self.__shards
+
+    @property
+    def locks(self):
+        """The locks guarding the corresponding caches in :attr:`shards`."""
+        return self.__locks
+
+
+class RWLock:
+    """Reader-writer lock allowing either a single writer or any number
+    of concurrent readers.
+
+    """
+
+    class _Reader:
+        __slots__ = ("__lock",)
+
+        def __init__(self, lock):
+            self.__lock = lock
+
+        def __enter__(self):
+            self.__lock.acquire_read()
+
+        def __exit__(self, *exc):
+            self.__lock.release_read()
+
+    def __init__(self):
+        self.__mutex = mutex = threading.Lock()
+        self.__cond = threading.Condition(mutex)
+        self.__readers = 0  # number of active readers
+        self.__writers = 0  # number of waiting writers
+        self.__writer = False
+        self.__reader = RWLock._Reader(self)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+    @property
+    def read(self):
+        """A context manager acquiring the lock for reading."""
+        return self.__reader
+
+    def acquire(self):
+        """Acquire the lock for writing, blocking until all readers and
+        writers have released it.
+
+        """
+        with self.__cond:
+            self.__writers += 1
+            while self.__writer or self.__readers:
+                self.__cond.wait()
+            self.__writers -= 1
+            self.__writer = True
+        return True
+
+    def release(self):
+        """Release the lock acquired for writing."""
+        with self.__cond:
+            if not self.__writer:
+                raise RuntimeError("release unlocked lock")
+            self.__writer = False
+            self.__cond.notify_all()
+
+    def acquire_read(self):
+        """Acquire the lock for reading, blocking while the lock is held
+        or waited for by a writer.
+
+        """
+        # readers only acquire the underlying mutex, unless they have
+        # to wait; waiting writers take precedence, so they will not starve
+        with self.__mutex:
+            if self.__writer or self.__writers:
+                self.__cond.wait_for(self.__readable)
+            self.__readers += 1
+        return True
+
+    def release_read(self):
+        """Release the lock acquired for reading."""
+        with self.__mutex:
+            if not self.__readers:
+                raise RuntimeError("release unlocked lock")
+            self.__readers -= 1
+            if not self.__readers and self.__writers:
+                self.__cond.notify_all()
+
+    def __readable(self):
+        return not (self.__writer or self.__writers)
+
+
 _CacheInfo = collections.namedtuple(
     "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
 )
@@ -725,7 +3017,7 @@ def cached(cache, key=keys.hashkey, lock=None, condition=None, info=False):
 
     def decorator(func):
         if info:
-            if isinstance(cache, Cache):
+            if isinstance(cache, (Cache, ShardedCache)):
 
                 def make_info(hits, misses):
                     return _CacheInfo(hits, misses, cache.maxsize, cache.currsize)
@@ -758,7 +3050,7 @@ def cachedmethod(cache, key=keys.methodkey, lock=None, condition=None, info=Fals
         if info:
 
             def make_info(cache, hits, misses):
-                if isinstance(cache, Cache):
+                if isinstance(cache, (Cache, ShardedCache)):
                     return _CacheInfo(hits, misses, cache.maxsize, cache.currsize)
                 elif isinstance(cache, collections.abc.Mapping):
                     return _CacheInfo(hits, misses, None, len(cache))
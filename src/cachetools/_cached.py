@@ -2,7 +2,13 @@
 
 __all__ = ()
 
+import contextlib
 import functools
+import itertools
+
+from . import Cache, RWLock, ShardedCache, _MISSING
+
+_UNLOCKED = contextlib.nullcontext()  # for lookups without locking
 
 # At least for now, the implementation prefers clarity and performance
 # over ease of maintenance, thus providing separate wrappers for
@@ -10,22 +16,71 @@ import functools
 # info.
 
 
+def _lookup(cache):
+    """Return a function for looking up a key in `cache` that returns a
+    default value instead of raising KeyError if the key is not found.
+
+    """
+    if isinstance(cache, (Cache, ShardedCache)):
+        return cache._lookup
+    elif type(cache) is dict:
+        return cache.get
+    else:
+
+        def lookup(key, default):
+            try:
+                return cache[key]
+            except KeyError:
+                return default
+
+        return lookup
+
+
+def _shared(cache):
+    """Return whether keys may be looked up in `cache` by concurrent
+    readers.
+
+    """
+    if isinstance(cache, Cache):
+        return cache._concurrent_lookup
+    else:
+        return type(cache) is dict or isinstance(cache, ShardedCache)
+
+
+def _unguarded(cache):
+    """Return whether keys may be looked up in `cache` without holding
+    a lock, i.e. concurrently with other threads updating the cache.
+
+    """
+    return isinstance(cache, Cache) and cache._lockfree_lookup
+
+
+def _reader(lock, cache):
+    """Return the context manager guarding key lookups in `cache`."""
+    if _unguarded(cache):
+        return _UNLOCKED
+    elif isinstance(lock, RWLock) and _shared(cache):
+        return lock.read
+    else:
+        return lock
+
+
 def _condition_info(func, cache, key, lock, cond, info):
     hits = misses = 0
     pending = set()
+    lookup = _lookup(cache)
 
     def wrapper(*args, **kwargs):
         nonlocal hits, misses
         k = key(*args, **kwargs)
         with lock:
             cond.wait_for(lambda: k not in pending)
-            try:
-                result = cache[k]
+            result = lookup(k, _MISSING)
+            if result is not _MISSING:
                 hits += 1
                 return result
-            except KeyError:
-                pending.add(k)
-                misses += 1
+            pending.add(k)
+            misses += 1
         try:
             v = func(*args, **kwargs)
             with lock:
@@ -56,17 +111,17 @@ def _condition_info(func, cache, key, lock, cond, info):
 
 def _locked_info(func, cache, key, lock, info):
     hits = misses = 0
+    lookup = _lookup(cache)
 
     def wrapper(*args, **kwargs):
         nonlocal hits, misses
         k = key(*args, **kwargs)
         with lock:
-            try:
-                result = cache[k]
+            result = lookup(k, _MISSING)
+            if result is not _MISSING:
                 hits += 1
                 return result
-            except KeyError:
-                misses += 1
+            misses += 1
         v = func(*args, **kwargs)
         with lock:
             try:
@@ -92,18 +147,113 @@ def _locked_info(func, cache, key, lock, info):
     return wrapper
 
 
+def _rwlocked_info(func, cache, key, lock, info):
+    # concurrent readers count hits and misses by calling next() on
+    # itertools.count() objects, which is atomic, and counts are only
+    # read or reset while holding the lock for writing
+    hits = itertools.count()
+    misses = itertools.count()
+    lookup = _lookup(cache)
+    reader = lock.read
+
+    def wrapper(*args, **kwargs):
+        k = key(*args, **kwargs)
+        with reader:
+            result = lookup(k, _MISSING)
+            if result is not _MISSING:
+                next(hits)
+                return result
+            next(misses)
+        v = func(*args, **kwargs)
+        with lock:
+            try:
+                # In case of a race condition, i.e. if another thread
+                # stored a value for this key while we were calling
+                # func(), prefer the cached value.
+                return cache.setdefault(k, v)
+            except ValueError:
+                return v  # value too large
+
+    def cache_clear():
+        nonlocal hits, misses
+        with lock:
+            cache.clear()
+            hits = itertools.count()
+            misses = itertools.count()
+
+    def cache_info():
+        nonlocal hits, misses
+        with lock:
+            h = next(hits)
+            m = next(misses)
+            hits = itertools.count(h)
+            misses = itertools.count(m)
+            return info(h, m)
+
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_info = cache_info
+    return wrapper
+
+
+def _lockfree_info(func, cache, key, lock, info):
+    # hits and misses are counted without holding the lock by calling
+    # next() on itertools.count() objects, which is atomic, so the
+    # calls to next() for reading or resetting counts are subtracted
+    hits = itertools.count()
+    misses = itertools.count()
+    hits_offset = misses_offset = 0
+    lookup = cache._lookup
+
+    def wrapper(*args, **kwargs):
+        k = key(*args, **kwargs)
+        result = lookup(k, _MISSING)
+        if result is not _MISSING:
+            next(hits)
+            return result
+        next(misses)
+        v = func(*args, **kwargs)
+        with lock:
+            try:
+                # In case of a race condition, i.e. if another thread
+                # stored a value for this key while we were calling
+                # func(), prefer the cached value.
+                return cache.setdefault(k, v)
+            except ValueError:
+                return v  # value too large
+
+    def cache_clear():
+        nonlocal hits_offset, misses_offset
+        with lock:
+            cache.clear()
+            hits_offset = next(hits) + 1
+            misses_offset = next(misses) + 1
+
+    def cache_info():
+        nonlocal hits_offset, misses_offset
+        with lock:
+            h = next(hits) - hits_offset
+            m = next(misses) - misses_offset
+            hits_offset += 1
+            misses_offset += 1
+            return info(h, m)
+
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_info = cache_info
+    return wrapper
+
+
 def _unlocked_info(func, cache, key, info):
     hits = misses = 0
+    lookup = _lookup(cache)
 
     def wrapper(*args, **kwargs):
         nonlocal hits, misses
         k = key(*args, **kwargs)
-        try:
-            result = cache[k]
+        result = lookup(k, _MISSING)
+        if result is not _MISSING:
             hits += 1
             return result
-        except KeyError:
-            misses += 1
+        misses += 1
         v = func(*args, **kwargs)
         try:
             cache[k] = v
@@ -141,18 +291,58 @@ def _uncached_info(func, info):
     return wrapper
 
 
+def _sharded_info(func, cache, key, info):
+    shards = cache.shards
+    locks = cache.locks
+    lookups = [_lookup(shard) for shard in shards]
+    hits = [0] * len(shards)
+    misses = [0] * len(shards)
+
+    def wrapper(*args, **kwargs):
+        k = key(*args, **kwargs)
+        i = hash(k) % len(shards)
+        with locks[i]:
+            result = lookups[i](k, _MISSING)
+            if result is not _MISSING:
+                hits[i] += 1
+                return result
+            misses[i] += 1
+        v = func(*args, **kwargs)
+        with locks[i]:
+            try:
+                # In case of a race condition, i.e. if another thread
+                # stored a value for this key while we were calling
+                # func(), prefer the cached value.
+                return shards[i].setdefault(k, v)
+            except ValueError:
+                return v  # value too large
+
+    def cache_clear():
+        for i, lock in enumerate(locks):
+            with lock:
+                shards[i].clear()
+                hits[i] = misses[i] = 0
+
+    def cache_info():
+        return info(sum(hits), sum(misses))
+
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_info = cache_info
+    return wrapper
+
+
 def _condition(func, cache, key, lock, cond):
     pending = set()
+    lookup = _lookup(cache)
 
     def wrapper(*args, **kwargs):
         k = key(*args, **kwargs)
         with lock:
             cond.wait_for(lambda: k not in pending)
-            try:
-                result = cache[k]
+            result = lookup(k, _MISSING)
+            if result is not _MISSING:
                 return result
-            except KeyError:
-                pending.add(k)
+            pending.add(k)
         try:
             v = func(*args, **kwargs)
             with lock:
@@ -175,13 +365,68 @@ def _condition(func, cache, key, lock, cond):
 
 
 def _locked(func, cache, key, lock):
+    lookup = _lookup(cache)
+
     def wrapper(*args, **kwargs):
         k = key(*args, **kwargs)
+        with lock:
+            result = lookup(k, _MISSING)
+            if result is not _MISSING:
+                return result
+        v = func(*args, **kwargs)
         with lock:
             try:
-                return cache[k]
-            except KeyError:
-                pass  # key not found
+                # In case of a race condition, i.e. if another thread
+                # stored a value for this key while we were calling
+                # func(), prefer the cached value.
+                return cache.setdefault(k, v)
+            except ValueError:
+                return v  # value too large
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def _rwlocked(func, cache, key, lock):
+    lookup = _lookup(cache)
+    reader = lock.read
+
+    def wrapper(*args, **kwargs):
+        k = key(*args, **kwargs)
+        with reader:
+            result = lookup(k, _MISSING)
+        if result is not _MISSING:
+            return result
+        v = func(*args, **kwargs)
+        with lock:
+            try:
+                # In case of a race condition, i.e. if another thread
+                # stored a value for this key while we were calling
+                # func(), prefer the cached value.
+                return cache.setdefault(k, v)
+            except ValueError:
+                return v  # value too large
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def _lockfree(func, cache, key, lock):
+    lookup = cache._lookup
+
+    def wrapper(*args, **kwargs):
+        k = key(*args, **kwargs)
+        result = lookup(k, _MISSING)
+        if result is not _MISSING:
+            return result
         v = func(*args, **kwargs)
         with lock:
             try:
@@ -201,12 +446,13 @@ def _locked(func, cache, key, lock):
 
 
 def _unlocked(func, cache, key):
+    lookup = _lookup(cache)
+
     def wrapper(*args, **kwargs):
         k = key(*args, **kwargs)
-        try:
-            return cache[k]
-        except KeyError:
-            pass  # key not found
+        result = lookup(k, _MISSING)
+        if result is not _MISSING:
+            return result
         v = func(*args, **kwargs)
         try:
             cache[k] = v
@@ -218,6 +464,32 @@ def _unlocked(func, cache, key):
     return wrapper
 
 
+def _sharded(func, cache, key):
+    shards = cache.shards
+    locks = cache.locks
+    lookups = [_lookup(shard) for shard in shards]
+
+    def wrapper(*args, **kwargs):
+        k = key(*args, **kwargs)
+        i = hash(k) % len(shards)
+        with locks[i]:
+            result = lookups[i](k, _MISSING)
+            if result is not _MISSING:
+                return result
+        v = func(*args, **kwargs)
+        with locks[i]:
+            try:
+                # In case of a race condition, i.e. if another thread
+                # stored a value for this key while we were calling
+                # func(), prefer the cached value.
+                return shards[i].setdefault(k, v)
+            except ValueError:
+                return v  # value too large
+
+    wrapper.cache_clear = lambda: cache.clear()
+    return wrapper
+
+
 def _uncached(func):
     def wrapper(*args, **kwargs):
         return func(*args, **kwargs)
@@ -234,8 +506,14 @@ def _wrapper(func, cache, key, lock=None, cond=None, info=None):
             wrapper = _condition_info(func, cache, key, lock, cond, info)
         elif cond is not None:
             wrapper = _condition_info(func, cache, key, cond, cond, info)
+        elif lock is not None and _unguarded(cache):
+            wrapper = _lockfree_info(func, cache, key, lock, info)
+        elif lock is not None and _reader(lock, cache) is not lock:
+            wrapper = _rwlocked_info(func, cache, key, lock, info)
         elif lock is not None:
             wrapper = _locked_info(func, cache, key, lock, info)
+        elif isinstance(cache, ShardedCache):
+            wrapper = _sharded_info(func, cache, key, info)
         else:
             wrapper = _unlocked_info(func, cache, key, info)
     else:
@@ -245,8 +523,14 @@ def _wrapper(func, cache, key, lock=None, cond=None, info=None):
             wrapper = _condition(func, cache, key, lock, cond)
         elif cond is not None:
             wrapper = _condition(func, cache, key, cond, cond)
+        elif lock is not None and _unguarded(cache):
+            wrapper = _lockfree(func, cache, key, lock)
+        elif lock is not None and _reader(lock, cache) is not lock:
+            wrapper = _rwlocked(func, cache, key, lock)
         elif lock is not None:
             wrapper = _locked(func, cache, key, lock)
+        elif isinstance(cache, ShardedCache):
+            wrapper = _sharded(func, cache, key)
         else:
             wrapper = _unlocked(func, cache, key)
         wrapper.cache_info = None
@@ -3,9 +3,12 @@
 __all__ = ()
 
 import functools
+import itertools
 import warnings
 import weakref
 
+from ._cached import _MISSING, _lookup, _reader
+
 
 def _warn_classmethod(stacklevel):
     warnings.warn(
@@ -39,6 +42,7 @@ class _WrapperBase:
         self.__key = functools.partial(key, obj)
         self.__lock = lock if lock is not None else _none
         self.__cond = cond if cond is not None else _none
+        self.__lookup = (None, None)  # (cache, lookup function) pair
 
     def __call__(self, *args, **kwargs):
         raise NotImplementedError()  # pragma: no cover
@@ -46,6 +50,16 @@ class _WrapperBase:
     def cache_clear(self):
         raise NotImplementedError()  # pragma: no cover
 
+    def _cache_lookup(self, cache):
+        """Return the lookup function for `cache`, computed only once
+        unless the method's cache changes.
+
+        """
+        pair = self.__lookup
+        if pair[0] is not cache:
+            self.__lookup = pair = (cache, _lookup(cache))
+        return pair[1]
+
     @property
     def cache(self):
         return self.__cache(self._obj)
@@ -161,13 +175,12 @@ def _condition_info(method, cache, key, lock, cond, info):
 
                 with lock:
                     cond.wait_for(lambda: key not in self.__pending)
-                    try:
-                        result = cache[key]
+                    result = self._cache_lookup(cache)(key, _MISSING)
+                    if result is not _MISSING:
                         self.__hits += 1
                         return result
-                    except KeyError:
-                        self.__pending.add(key)
-                        self.__misses += 1
+                    self.__pending.add(key)
+                    self.__misses += 1
                 try:
                     val = method(self._obj, *args, **kwargs)
                     with lock:
@@ -198,19 +211,23 @@ def _locked_info(method, cache, key, lock, info):
         class Wrapper(_WrapperBase):
             def __init__(self, obj):
                 super().__init__(obj, method, cache, key, lock)
-                self.__hits = self.__misses = 0
+                # concurrent readers count hits and misses by calling
+                # next(), which is atomic, so the calls to next() for
+                # reading or resetting counts are subtracted
+                self.__hits = itertools.count()
+                self.__misses = itertools.count()
+                self.__hits_offset = self.__misses_offset = 0
 
             def __call__(self, *args, **kwargs):
                 cache = self.cache
                 lock = self.cache_lock
                 key = self.cache_key(*args, **kwargs)
-                with lock:
-                    try:
-                        result = cache[key]
-                        self.__hits += 1
+                with _reader(lock, cache):
+                    result = self._cache_lookup(cache)(key, _MISSING)
+                    if result is not _MISSING:
+                        next(self.__hits)
                         return result
-                    except KeyError:
-                        self.__misses += 1
+                    next(self.__misses)
                 val = method(self._obj, *args, **kwargs)
                 with lock:
                     try:
@@ -224,11 +241,16 @@ def _locked_info(method, cache, key, lock, info):
             def cache_clear(self):
                 with self.cache_lock:
                     self.cache.clear()
-                    self.__hits = self.__misses = 0
+                    self.__hits_offset = next(self.__hits) + 1
+                    self.__misses_offset = next(self.__misses) + 1
 
             def cache_info(self):
                 with self.cache_lock:
-                    return info(self.cache, self.__hits, self.__misses)
+                    hits = next(self.__hits) - self.__hits_offset
+                    misses = next(self.__misses) - self.__misses_offset
+                    self.__hits_offset += 1
+                    self.__misses_offset += 1
+                    return info(self.cache, hits, misses)
 
     return Descriptor()
 
@@ -243,12 +265,11 @@ def _unlocked_info(method, cache, key, info):
             def __call__(self, *args, **kwargs):
                 cache = self.cache
                 key = self.cache_key(*args, **kwargs)
-                try:
-                    result = cache[key]
+                result = self._cache_lookup(cache)(key, _MISSING)
+                if result is not _MISSING:
                     self.__hits += 1
                     return result
-                except KeyError:
-                    self.__misses += 1
+                self.__misses += 1
                 val = method(self._obj, *args, **kwargs)
                 try:
                     cache[key] = val
@@ -270,15 +291,15 @@ def _condition(method, cache, key, lock, cond):
     # backward-compatible weakref dictionary for Python >= 3.13
     pending = weakref.WeakKeyDictionary()
 
-    def wrapper(self, pending, *args, **kwargs):
+    def wrapper(self, pending, lookup, *args, **kwargs):
         c = cache(self)
         k = key(self, *args, **kwargs)
         with lock(self):
             cond(self).wait_for(lambda: k not in pending)
-            try:
-                return c[k]
-            except KeyError:
-                pending.add(k)
+            result = lookup(c)(k, _MISSING)
+            if result is not _MISSING:
+                return result
+            pending.add(k)
         try:
             v = method(self, *args, **kwargs)
             with lock(self):
@@ -299,7 +320,7 @@ def _condition(method, cache, key, lock, cond):
 
     def classmethod_wrapper(self, *args, **kwargs):
         p = pending.setdefault(self, set())
-        return wrapper(self, p, *args, **kwargs)
+        return wrapper(self, p, _lookup, *args, **kwargs)
 
     class Descriptor(_DeprecatedDescriptorBase):
         class Wrapper(_WrapperBase):
@@ -308,7 +329,9 @@ def _condition(method, cache, key, lock, cond):
                 self.__pending = set()
 
             def __call__(self, *args, **kwargs):
-                return wrapper(self._obj, self.__pending, *args, **kwargs)
+                return wrapper(
+                    self._obj, self.__pending, self._cache_lookup, *args, **kwargs
+                )
 
             # objtype: backward-compatible @classmethod handling with Python < 3.13
             def cache_clear(self, _objtype=None):
@@ -318,14 +341,13 @@ def _condition(method, cache, key, lock, cond):
 
 
 def _locked(method, cache, key, lock):
-    def wrapper(self, *args, **kwargs):
+    def wrapper(self, lookup, *args, **kwargs):
         c = cache(self)
         k = key(self, *args, **kwargs)
-        with lock(self):
-            try:
-                return c[k]
-            except KeyError:
-                pass  # key not found
+        with _reader(lock(self), c):
+            result = lookup(c)(k, _MISSING)
+            if result is not _MISSING:
+                return result
         v = method(self, *args, **kwargs)
         with lock(self):
             try:
@@ -341,29 +363,31 @@ def _locked(method, cache, key, lock):
         with lock(self):
             c.clear()
 
+    def classmethod_wrapper(self, *args, **kwargs):
+        return wrapper(self, _lookup, *args, **kwargs)
+
     class Descriptor(_DeprecatedDescriptorBase):
         class Wrapper(_WrapperBase):
             def __init__(self, obj):
                 super().__init__(obj, method, cache, key, lock)
 
             def __call__(self, *args, **kwargs):
-                return wrapper(self._obj, *args, **kwargs)
+                return wrapper(self._obj, self._cache_lookup, *args, **kwargs)
 
             # objtype: backward-compatible @classmethod handling with Python < 3.13
             def cache_clear(self, _objtype=None):
                 return cache_clear(self._obj)
 
-    return Descriptor(wrapper, cache_clear)
+    return Descriptor(classmethod_wrapper, cache_clear)
 
 
 def _unlocked(method, cache, key):
-    def wrapper(self, *args, **kwargs):
+    def wrapper(self, lookup, *args, **kwargs):
         c = cache(self)
         k = key(self, *args, **kwargs)
-        try:
-            return c[k]
-        except KeyError:
-            pass  # key not found
+        result = lookup(c)(k, _MISSING)
+        if result is not _MISSING:
+            return result
         v = method(self, *args, **kwargs)
         try:
             c[k] = v
@@ -375,19 +399,22 @@ def _unlocked(method, cache, key):
         c = cache(self)
         c.clear()
 
+    def classmethod_wrapper(self, *args, **kwargs):
+        return wrapper(self, _lookup, *args, **kwargs)
+
     class Descriptor(_DeprecatedDescriptorBase):
         class Wrapper(_WrapperBase):
             def __init__(self, obj):
                 super().__init__(obj, method, cache, key)
 
             def __call__(self, *args, **kwargs):
-                return wrapper(self._obj, *args, **kwargs)
+                return wrapper(self._obj, self._cache_lookup, *args, **kwargs)
 
             # objtype: backward-compatible @classmethod handling with Python < 3.13
             def cache_clear(self, _objtype=None):
                 return cache_clear(self._obj)
 
-    return Descriptor(wrapper, cache_clear)
+    return Descriptor(classmethod_wrapper, cache_clear)
 
 
 def _wrapper(method, cache, key, lock=None, cond=None, info=None):
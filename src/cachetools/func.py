@@ -1,6 +1,13 @@
 """`functools.lru_cache` compatible memoizing function decorators."""
 
-__all__ = ("fifo_cache", "lfu_cache", "lru_cache", "rr_cache", "ttl_cache")
+__all__ = (
+    "arc_cache",
+    "fifo_cache",
+    "lfu_cache",
+    "lru_cache",
+    "rr_cache",
+    "ttl_cache",
+)
 
 import functools
 import math
@@ -8,7 +15,7 @@ import random
 import time
 from threading import Condition
 
-from . import FIFOCache, LFUCache, LRUCache, RRCache, TTLCache
+from . import ARCCache, FIFOCache, LFUCache, LRUCache, RRCache, TTLCache
 from . import cached
 from . import keys
 
@@ -35,6 +42,20 @@ def _cache(cache, maxsize, typed):
     return decorator
 
 
+def arc_cache(maxsize=128, typed=False):
+    """Decorator to wrap a function with a memoizing callable that saves
+    up to `maxsize` results based on an Adaptive Replacement Cache
+    (ARC) algorithm.
+
+    """
+    if maxsize is None:
+        return _cache({}, None, typed)
+    elif callable(maxsize):
+        return _cache(ARCCache(128), 128, typed)(maxsize)
+    else:
+        return _cache(ARCCache(maxsize), maxsize, typed)
+
+
 def fifo_cache(maxsize=128, typed=False):
     """Decorator to wrap a function with a memoizing callable that saves
     up to `maxsize` results based on a First In First Out (FIFO)
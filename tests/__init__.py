@@ -1,5 +1,8 @@
+import random
 import unittest
 
+from cachetools import RWLock
+
 
 class CacheTestMixin:
     Cache = None
@@ -317,6 +320,238 @@ class CacheTestMixin:
         self.assertEqual(1, len(cache))
         self.assertEqual(4, cache.currsize)
 
+    def test_popitem_subclass(self):
+        class Cache(self.Cache):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.evicted = []
+
+            def popitem(self):
+                item = super().popitem()
+                self.evicted.append(item)
+                return item
+
+        cache = Cache(maxsize=2)
+        cache.update({1: 1, 2: 2, 3: 3, 4: 4})
+        self.assertEqual(2, len(cache))
+        self.assertEqual(2, len(cache.evicted))
+        for key, value in cache.evicted:
+            self.assertEqual(key, value)
+            self.assertNotIn(key, cache)
+
+    def test_lookup(self):
+        cache = self.Cache(maxsize=2)
+        marker = object()
+        cache.update({1: 1, 2: None})
+        self.assertEqual(1, cache._lookup(1, marker))
+        self.assertIsNone(cache._lookup(2, marker))
+        self.assertIs(marker, cache._lookup(3, marker))
+        self.assertIsNone(cache._lookup(3))
+        self.assertEqual(2, len(cache))
+
+    def test_lookup_hit(self):
+        def evictions(get):
+            random.seed(0)  # for random eviction
+            cache = self.Cache(maxsize=4)
+            evicted = []
+            for key in [1, 2, 3, 4, 1, 1, 5, 3, 6, 1, 7, 3, 8, 9, 1]:
+                if get(cache, key) is None:
+                    cache[key] = key
+                    evicted.append(sorted(cache))
+            return evicted
+
+        # hits recorded by _lookup() affect eviction like __getitem__()
+        self.assertEqual(
+            evictions(lambda cache, key: cache.get(key)),
+            evictions(lambda cache, key: cache._lookup(key)),
+        )
+
+    def test_lookup_subclass(self):
+        class DefaultCache(self.Cache):
+            def __missing__(self, key):
+                return -key
+
+        class LoggingCache(self.Cache):
+            def __getitem__(self, key):
+                self.keys.append(key)
+                return super().__getitem__(key)
+
+        cache = DefaultCache(maxsize=2)
+        cache[1] = 1
+        self.assertEqual(1, cache._lookup(1, None))
+        self.assertEqual(-2, cache._lookup(2, None))
+
+        cache = LoggingCache(maxsize=2)
+        cache.keys = []
+        cache[1] = 1
+        self.assertEqual(1, cache._lookup(1, None))
+        self.assertIsNone(cache._lookup(2, None))
+        self.assertEqual([1, 2], cache.keys)
+
+    def test_on_evict(self):
+        batches = []
+        cache = self.Cache(maxsize=2, on_evict=batches.append)
+        self.assertEqual(batches.append, cache.on_evict)
+        self.assertIsNone(self.Cache(maxsize=2).on_evict)
+
+        cache.update({1: 1, 2: 2, 3: 3})
+        self.assertEqual(1, len(batches))
+        ((key, value, reason),) = batches.pop()
+        self.assertEqual(key, value)
+        self.assertEqual("size", reason)
+        self.assertNotIn(key, cache)
+
+        key = next(iter(cache))
+        value = cache[key]
+        cache[key] = "replaced"
+        self.assertEqual([[(key, value, "replaced")]], batches)
+        batches.clear()
+
+        del cache[key]
+        self.assertEqual([[(key, "replaced", "explicit")]], batches)
+        batches.clear()
+
+        items = sorted(cache.items())
+        cache.clear()
+        self.assertEqual(1, len(batches))
+        self.assertEqual(items, sorted((k, v) for k, v, _ in batches[0]))
+        self.assertEqual({"explicit"}, {r for _, _, r in batches[0]})
+
+    def test_on_evict_batch(self):
+        batches = []
+        cache = self.Cache(maxsize=4, low_watermark=2, on_evict=batches.append)
+
+        cache.update({1: 1, 2: 2, 3: 3, 4: 4})
+        self.assertEqual([], batches)
+        cache[5] = 5
+        self.assertEqual(1, len(batches))
+        self.assertEqual(2, len(batches[0]))
+        for key, value, reason in batches[0]:
+            self.assertEqual(key, value)
+            self.assertEqual("size", reason)
+            self.assertNotIn(key, cache)
+        batches.clear()
+
+        cache.set_many((n, n) for n in range(6, 10))
+        self.assertEqual(1, len(batches))
+        self.assertEqual({"size"}, {r for _, _, r in batches[0]})
+        batches.clear()
+
+        self.assertEqual(len(cache), cache.delete_many(list(cache)))
+        self.assertEqual(1, len(batches))
+        self.assertEqual({"explicit"}, {r for _, _, r in batches[0]})
+
+    def test_on_evict_replaced(self):
+        batches = []
+        cache = self.Cache(maxsize=3, getsizeof=lambda x: x, on_evict=batches.append)
+        cache.update({1: 1, 2: 1, 3: 1})
+
+        # items evicted to make space are reported with the replaced item
+        key = max(cache)
+        cache[key] = 2
+        self.assertEqual(2, cache[key])
+        self.assertEqual(1, len(batches))
+        self.assertIn((key, 1), [(k, v) for k, v, _ in batches[0]])
+        self.assertIn("size", [r for _, _, r in batches[0]])
+
+    def test_low_watermark(self):
+        cache = self.Cache(maxsize=4)
+        self.assertEqual(4, cache.low_watermark)
+
+        cache = self.Cache(maxsize=4, low_watermark=2)
+        self.assertEqual(2, cache.low_watermark)
+
+        cache.update({1: 1, 2: 2, 3: 3, 4: 4})
+        self.assertEqual(4, len(cache))
+
+        cache[5] = 5
+        self.assertEqual(3, len(cache))
+        self.assertEqual(3, cache.currsize)
+        self.assertEqual(5, cache[5])
+
+        cache[6] = 6
+        self.assertEqual(4, len(cache))
+        cache[7] = 7
+        self.assertEqual(3, len(cache))
+        self.assertEqual(7, cache[7])
+
+    def test_low_watermark_invalid(self):
+        with self.assertRaises(ValueError):
+            self.Cache(maxsize=4, low_watermark=5)
+        with self.assertRaises(ValueError):
+            self.Cache(maxsize=4, low_watermark=-1)
+        cache = self.Cache(maxsize=4, low_watermark=0)
+        self.assertEqual(0, cache.low_watermark)
+
+    def test_low_watermark_getsizeof(self):
+        cache = self.Cache(maxsize=10, low_watermark=5, getsizeof=lambda x: x)
+
+        cache.update({1: 3, 2: 3, 3: 3})
+        self.assertEqual(9, cache.currsize)
+
+        cache[4] = 4
+        self.assertEqual(2, len(cache))
+        self.assertEqual(7, cache.currsize)
+        self.assertEqual(4, cache[4])
+
+        # evict at least as much as required for the new item
+        cache[5] = 10
+        self.assertEqual(1, len(cache))
+        self.assertEqual(10, cache.currsize)
+
+    def test_get_many(self):
+        cache = self.Cache(maxsize=2)
+        cache.update({1: 1, 2: 2})
+
+        self.assertEqual({}, cache.get_many([]))
+        self.assertEqual({1: 1, 2: 2}, cache.get_many([1, 2]))
+        self.assertEqual({2: 2}, cache.get_many(iter([2, 3])))
+        self.assertEqual({}, cache.get_many([3, 4]))
+        self.assertEqual(2, len(cache))
+
+    def test_set_many(self):
+        cache = self.Cache(maxsize=2)
+
+        cache.set_many({})
+        self.assertEqual(0, len(cache))
+
+        cache.set_many({1: 1, 2: 2})
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache[1])
+        self.assertEqual(2, cache[2])
+
+        cache.set_many([(2, "two"), (3, 3)])
+        self.assertEqual(2, len(cache))
+        self.assertEqual(3, cache[3])
+        self.assertTrue(1 in cache or 2 in cache)
+
+        cache.set_many((n, n) for n in range(10))
+        self.assertEqual(2, len(cache))
+        self.assertEqual(9, cache[9])
+
+    def test_set_many_getsizeof(self):
+        cache = self.Cache(maxsize=3, getsizeof=lambda x: x)
+
+        with self.assertRaises(ValueError):
+            cache.set_many({1: 1, 2: 2, 4: 4})
+        self.assertEqual(3, cache.currsize)
+        self.assertNotIn(4, cache)
+
+    def test_delete_many(self):
+        cache = self.Cache(maxsize=3)
+        cache.update({1: 1, 2: 2, 3: 3})
+
+        self.assertEqual(0, cache.delete_many([]))
+        self.assertEqual(2, cache.delete_many([1, 2, 4]))
+        self.assertEqual(1, len(cache))
+        self.assertEqual(1, cache.currsize)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertEqual(3, cache[3])
+
+        self.assertEqual(0, cache.delete_many([1, 2]))
+        self.assertEqual(1, len(cache))
+
     def test_pickle(self):
         import pickle
 
@@ -381,3 +616,18 @@ class CountedCondition(CountedLock):
 
     def notify_all(self):
         self.notify_count += 1
+
+
+class CountedRWLock(RWLock):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.read_count = 0
+
+    def acquire(self):
+        self.count += 1
+        return super().acquire()
+
+    def acquire_read(self):
+        self.read_count += 1
+        return super().acquire_read()
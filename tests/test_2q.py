@@ -0,0 +1,116 @@
+import unittest
+
+from cachetools import TwoQueueCache
+
+from . import CacheTestMixin
+
+
+class TwoQueueCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = TwoQueueCache
+
+    def test_2q(self):
+        cache = TwoQueueCache(maxsize=4)
+        self.assertEqual(0.25, cache.kin)
+        self.assertEqual(0.5, cache.kout)
+
+        for n in range(4):
+            cache[n] = n
+        cache[0]  # new items are not reordered
+        cache[4] = 4
+
+        self.assertEqual(len(cache), 4)
+        self.assertNotIn(0, cache)
+        self.assertIn(1, cache)
+
+        # remembered keys are reused when added again
+        cache[0] = 0
+        self.assertNotIn(1, cache)
+        for n in range(5, 10):
+            cache[n] = n
+        self.assertIn(0, cache)
+        self.assertNotIn(2, cache)
+        self.assertNotIn(5, cache)
+
+    def test_2q_ghosts(self):
+        cache = TwoQueueCache(maxsize=4, kout=0.5)
+
+        for n in range(10):
+            cache[n] = n
+
+        # only a bounded number of evicted keys is remembered
+        cache[0] = 0
+        cache[4] = 4
+        cache[6] = 6
+        for n in range(10, 13):
+            cache[n] = n
+        self.assertNotIn(0, cache)
+        self.assertNotIn(4, cache)
+        self.assertIn(6, cache)
+
+    def test_2q_getsizeof(self):
+        cache = TwoQueueCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_2q_getsizeof_scan(self):
+        for maxsize, getsizeof in ((10, None), (100, lambda v: 10)):
+            cache = TwoQueueCache(maxsize=maxsize, getsizeof=getsizeof)
+            for n in range(4):
+                cache[n] = n
+            for n in range(100, 110):
+                cache[n] = n
+            # remembered keys are added to the hot items
+            for n in range(4):
+                cache[n] = n
+            # hot items survive a scan
+            for n in range(200, 230):
+                cache[n] = n
+            for n in range(4):
+                self.assertIn(n, cache)
+
+    def test_2q_getsizeof_ghosts(self):
+        cache = TwoQueueCache(maxsize=100, kout=0.5, getsizeof=lambda v: v)
+        for n in range(100):
+            cache[n] = 20
+
+        # evicted keys hold no sizes, and are bounded by the item count
+        a1out = cache._TwoQueueCache__a1out
+        self.assertEqual([95, 96, 97, 98, 99], sorted(cache))
+        self.assertEqual([93, 94], list(a1out))
+        self.assertEqual({None}, set(a1out.values()))
+
+    def test_2q_clear(self):
+        cache = TwoQueueCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+        # verify evicted keys are forgotten after clear
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
@@ -0,0 +1,126 @@
+import unittest
+
+from cachetools import ARCCache
+
+from . import CacheTestMixin
+
+
+class ARCCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = ARCCache
+
+    def test_arc(self):
+        cache = ARCCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[2], 2)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+
+        cache[4] = 4
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[4], 4)
+        self.assertNotIn(1, cache)
+
+    def test_arc_frequency(self):
+        cache = ARCCache(maxsize=3)
+
+        cache[1] = 1
+        cache[1]  # promote to frequently used
+        cache[2] = 2
+        cache[3] = 3
+
+        # recently used items are evicted before frequently used ones
+        for n in range(4, 10):
+            cache[n] = n
+            self.assertIn(1, cache)
+            self.assertIn(n, cache)
+        self.assertEqual(len(cache), 3)
+
+    def test_arc_ghost(self):
+        cache = ARCCache(maxsize=2)
+
+        cache[1] = 1
+        cache[1]
+        cache[2] = 2
+        cache[3] = 3
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        # a ghost hit on a recently evicted key favors recency, so the
+        # frequently used item is evicted instead of the recent one
+        cache[2] = 2
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertNotIn(1, cache)
+
+    def test_arc_scan(self):
+        cache = ARCCache(maxsize=10)
+
+        for n in range(5):
+            cache[n] = n
+            cache[n]
+
+        # a scan of items seen only once does not flush the hot set
+        for n in range(100, 200):
+            cache[n] = n
+        for n in range(5):
+            self.assertIn(n, cache)
+
+    def test_arc_getsizeof(self):
+        cache = ARCCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_arc_update_existing(self):
+        cache = ARCCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[1] = "updated"
+        cache[3] = 3
+
+        self.assertEqual(cache[1], "updated")
+        self.assertIn(3, cache)
+        self.assertNotIn(2, cache)
+
+    def test_arc_clear(self):
+        cache = ARCCache(maxsize=2)
+
+        cache[1] = 1
+        cache[1]
+        cache[2] = 2
+        cache[3] = 3
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+        # verify history is reset after clear
+        cache[2] = 2
+        cache[3] = 3
+        cache[4] = 4
+        self.assertEqual(2, len(cache))
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
@@ -1,10 +1,11 @@
+import collections
 import unittest
 import warnings
 
 import cachetools
 import cachetools.keys
 
-from . import CountedCondition, CountedLock
+from . import CountedCondition, CountedLock, CountedRWLock
 
 
 class DecoratorTestMixin:
@@ -343,6 +344,87 @@ class CacheWrapperTest(unittest.TestCase, DecoratorTestMixin):
         self.assertEqual(wrapper.cache_info(), (0, 1, 0, 0))
         self.assertEqual(lock.count, 4)
 
+    def test_decorator_rwlock(self):
+        cache = self.cache(2)
+        lock = CountedRWLock()
+        wrapper = cachetools.cached(cache, lock=lock)(self.func)
+
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual((1, 1), (lock.read_count, lock.count))
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual((2, 1), (lock.read_count, lock.count))
+        wrapper.cache_clear()
+        self.assertEqual((2, 2), (lock.read_count, lock.count))
+        self.assertEqual(len(cache), 0)
+
+    def test_decorator_rwlock_info(self):
+        cache = self.cache(2)
+        lock = CountedRWLock()
+        wrapper = cachetools.cached(cache, lock=lock, info=True)(self.func)
+
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual((3, 2), (lock.read_count, lock.count))
+        self.assertEqual(wrapper.cache_info(), (1, 2, 2, 2))
+        wrapper.cache_clear()
+        self.assertEqual(wrapper.cache_info(), (0, 0, 2, 0))
+
+    def test_decorator_rwlock_exclusive(self):
+        # LRUCache reorders items on lookup
+        cache = cachetools.LRUCache(maxsize=2)
+        lock = CountedRWLock()
+        wrapper = cachetools.cached(cache, lock=lock, info=True)(self.func)
+
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual((0, 3), (lock.read_count, lock.count))
+        self.assertEqual(wrapper.cache_info(), (1, 1, 2, 1))
+
+    def test_decorator_missing(self):
+        class DefaultCache(cachetools.Cache):
+            def __missing__(self, key):
+                return -1
+
+        cache = DefaultCache(maxsize=2)
+        wrapper = cachetools.cached(cache, info=True)(self.func)
+        self.assertEqual(wrapper(0), -1)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(wrapper.cache_info(), (1, 0, 2, 0))
+
+
+class ShardedWrapperTest(unittest.TestCase, DecoratorTestMixin):
+    def cache(self, minsize):
+        return cachetools.ShardedCache(maxsize=minsize * 2, shards=2)
+
+    def test_decorator_info(self):
+        cache = self.cache(2)
+        wrapper = cachetools.cached(cache, info=True)(self.func)
+        self.assertEqual(wrapper.cache_info(), (0, 0, 4, 0))
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual(wrapper.cache_info(), (0, 1, 4, 1))
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual(wrapper.cache_info(), (0, 2, 4, 2))
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual(wrapper.cache_info(), (1, 2, 4, 2))
+        wrapper.cache_clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(wrapper.cache_info(), (0, 0, 4, 0))
+
+    def test_decorator_shard_locks(self):
+        cache = cachetools.ShardedCache(maxsize=4, shards=2)
+        wrapper = cachetools.cached(cache, info=True)(self.func)
+        self.assertIsNone(wrapper.cache_lock)
+
+        self.assertEqual(wrapper(0), 0)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual(wrapper(0), 0)
+        k0 = cachetools.keys.hashkey(0)
+        k1 = cachetools.keys.hashkey(1)
+        self.assertIn(k0, cache.shards[hash(k0) % 2])
+        self.assertIn(k1, cache.shards[hash(k1) % 2])
+        self.assertEqual(wrapper.cache_info(), (1, 2, 4, 2))
+
 
 class DictWrapperTest(unittest.TestCase, DecoratorTestMixin):
     def cache(self, minsize):
@@ -363,6 +445,11 @@ class DictWrapperTest(unittest.TestCase, DecoratorTestMixin):
         self.assertEqual(wrapper.cache_info(), (0, 0, None, 0))
 
 
+class UserDictWrapperTest(DictWrapperTest):
+    def cache(self, minsize):
+        return collections.UserDict()
+
+
 class NoneWrapperTest(unittest.TestCase):
     def func(self, *args, **kwargs):
         return args + tuple(kwargs.items())
@@ -1,3 +1,4 @@
+import collections
 import unittest
 import unittest.mock
 import warnings
@@ -5,7 +6,7 @@ import warnings
 
 from cachetools import Cache, cachedmethod, keys
 
-from . import CountedCondition, CountedLock
+from . import CountedCondition, CountedLock, CountedRWLock
 
 
 class Cached:
@@ -94,6 +95,20 @@ class MethodDecoratorTestMixin:
         cached.cache.clear()
         self.assertEqual(cached.get(1), 2)
 
+    def test_decorator_replace_cache(self):
+        cached = Cached(self.cache(2))
+
+        for method in (cached.get, cached.get_lock, cached.get_cond, cached.get_info):
+            cached.cache = self.cache(2)
+            result = method(0)
+            self.assertEqual(method(0), result)
+            self.assertEqual(1, len(cached.cache))
+
+            # lookups use the current cache
+            cached.cache = self.cache(2)
+            self.assertEqual(method(0), result + 1)
+            self.assertEqual(1, len(cached.cache))
+
     def test_decorator_typed(self):
         cached = Cached(self.cache(3))
 
@@ -233,6 +248,26 @@ class MethodDecoratorTestMixin:
         self.assertEqual(cached.get_lock_info(0), 0)
         self.assertEqual(cached.get_lock_info.cache_info(), (0, 1, maxsize, 1))
 
+    def test_decorator_rwlock(self):
+        cache = self.cache(2)
+        cached = Cached(cache)
+        cached.lock = CountedRWLock()
+
+        maxsize = cache.maxsize if isinstance(cache, Cache) else None
+
+        self.assertEqual(cached.get_lock(0), 0)
+        self.assertEqual(cached.get_lock(0), 0)
+        self.assertEqual(cached.get_lock_info(1), 1)
+        self.assertEqual(cached.get_lock_info(1), 1)
+        self.assertEqual(cached.get_lock_info.cache_info(), (1, 1, maxsize, 2))
+        if type(cache) in (Cache, dict):
+            # lookups are shared, only stores are exclusive
+            self.assertEqual(cached.lock.read_count, 4)
+            self.assertEqual(cached.lock.count, 3)
+        else:
+            self.assertEqual(cached.lock.read_count, 0)
+            self.assertEqual(cached.lock.count, 7)
+
     def test_decorator_cond_info(self):
         cache = self.cache(2)
         cached = Cached(cache)
@@ -642,6 +677,12 @@ class DictMethodTest(unittest.TestCase, MethodDecoratorTestMixin):
         return dict()
 
 
+class UserDictMethodTest(unittest.TestCase, MethodDecoratorTestMixin):
+
+    def cache(self, _minsize):
+        return collections.UserDict()
+
+
 class WeakRefMethodTest(unittest.TestCase):
 
     def test_weakref(self):
@@ -0,0 +1,93 @@
+import unittest
+
+from cachetools import ClockCache
+
+from . import CacheTestMixin
+
+
+class ClockCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = ClockCache
+
+    def test_clock(self):
+        cache = ClockCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[2], 2)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+
+        cache[4] = 4  # all referenced, evict after full sweep
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[4], 4)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+
+        cache[5] = 5
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[4], 4)
+        self.assertEqual(cache[5], 5)
+        self.assertNotIn(3, cache)
+
+    def test_clock_second_chance(self):
+        cache = ClockCache(maxsize=3)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[1]
+
+        cache[4] = 4
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        cache[5] = 5
+        self.assertIn(1, cache)
+        self.assertNotIn(3, cache)
+
+        cache[6] = 6
+        self.assertNotIn(1, cache)
+        self.assertIn(4, cache)
+        self.assertIn(5, cache)
+        self.assertIn(6, cache)
+
+    def test_clock_delete(self):
+        cache = ClockCache(maxsize=3)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        del cache[2]
+        cache[4] = 4
+
+        self.assertEqual(len(cache), 3)
+        cache[5] = 5
+        self.assertNotIn(1, cache)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+        self.assertIn(5, cache)
+
+    def test_clock_getsizeof(self):
+        cache = ClockCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
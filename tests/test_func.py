@@ -104,6 +104,10 @@ class DecoratorTestMixin:
         self.assertEqual(cached(RecursiveEquals(True)), RecursiveEquals(True))
 
 
+class ARCDecoratorTest(unittest.TestCase, DecoratorTestMixin):
+    DECORATOR = staticmethod(cachetools.func.arc_cache)
+
+
 class FIFODecoratorTest(unittest.TestCase, DecoratorTestMixin):
     DECORATOR = staticmethod(cachetools.func.fifo_cache)
 
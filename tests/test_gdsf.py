@@ -0,0 +1,97 @@
+import unittest
+
+from cachetools import GDSFCache
+
+from . import CacheTestMixin
+
+
+class GDSFCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = GDSFCache
+
+    def test_gdsf(self):
+        cache = GDSFCache(maxsize=2)
+        self.assertEqual(0, cache.clock)
+        self.assertEqual(1, cache.getcost(None, None))
+
+        cache[1] = 1
+        cache[1]
+        cache[1]
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(1, cache)
+        self.assertIn(3, cache)
+        self.assertNotIn(2, cache)
+        self.assertEqual(1, cache.clock)
+
+        # new items are inserted with priority relative to clock
+        cache[4] = 4
+        self.assertEqual(len(cache), 2)
+        self.assertIn(1, cache)
+        self.assertIn(4, cache)
+        self.assertNotIn(3, cache)
+        self.assertEqual(2, cache.clock)
+
+    def test_gdsf_cost(self):
+        cache = GDSFCache(maxsize=3, getcost=lambda k, v: v)
+        self.assertEqual(5, cache.getcost(None, 5))
+
+        cache[1] = 10
+        cache[2] = 1
+        cache[3] = 5
+        cache[4] = 2
+
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn(2, cache)
+        self.assertIn(1, cache)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+
+    def test_gdsf_size(self):
+        cache = GDSFCache(maxsize=10, getsizeof=len)
+
+        cache["a"] = "x" * 8
+        cache["b"] = "x"
+        cache["c"] = "x"
+        cache["d"] = "x"
+
+        # one large item is evicted instead of many small ones
+        self.assertEqual(3, len(cache))
+        self.assertEqual(3, cache.currsize)
+        self.assertNotIn("a", cache)
+
+    def test_gdsf_getcost_subclass(self):
+        class Cache(GDSFCache):
+            def getcost(self, key, value):
+                return key
+
+        cache = Cache(maxsize=2)
+        cache[3] = None
+        cache[1] = None
+        cache[2] = None
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
+
+    def test_gdsf_heap_cleanup(self):
+        cache = GDSFCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        for _ in range(100):
+            cache[1]
+            cache[2]
+        self.assertLessEqual(len(cache._GDSFCache__order), 2 * len(cache) + 1)
+
+    def test_gdsf_clear(self):
+        cache = GDSFCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+        self.assertEqual(0, cache.clock)
@@ -0,0 +1,145 @@
+import random
+import unittest
+
+from cachetools import HyperbolicCache
+
+from . import CacheTestMixin
+
+
+class RoundRobin:
+    def __init__(self):
+        self.index = 0
+
+    def __call__(self, seq):
+        self.index += 1
+        return seq[self.index % len(seq)]
+
+
+class HyperbolicCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = HyperbolicCache
+
+    def test_hyperbolic(self):
+        choice = RoundRobin()
+        cache = HyperbolicCache(maxsize=2, samples=2, choice=choice)
+        self.assertEqual(2, cache.samples)
+        self.assertIs(choice, cache.choice)
+        self.assertIsNone(cache.timer)
+        self.assertEqual(1, cache.getcost(None, None))
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[1]
+        cache[1]
+        cache[1]
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(1, cache)
+        self.assertIn(3, cache)
+        self.assertNotIn(2, cache)
+
+        # popularity decays with time spent in the cache
+        cache[3]
+        cache[3]
+        cache[4] = 4
+        self.assertEqual(len(cache), 2)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+        self.assertNotIn(1, cache)
+
+    def test_hyperbolic_cost(self):
+        cache = HyperbolicCache(
+            maxsize=3, samples=3, choice=RoundRobin(), getcost=lambda k, v: v
+        )
+        self.assertEqual(5, cache.getcost(None, 5))
+
+        cache[1] = 10
+        cache[2] = 1
+        cache[3] = 5
+        cache[4] = 2
+
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn(2, cache)
+        self.assertIn(1, cache)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+
+    def test_hyperbolic_timer(self):
+        class Timer:
+            def __init__(self):
+                self.time = 0
+
+            def __call__(self):
+                return self.time
+
+        timer = Timer()
+        cache = HyperbolicCache(maxsize=2, samples=2, choice=RoundRobin(), timer=timer)
+        self.assertIs(timer, cache.timer)
+
+        cache[1] = 1
+        timer.time = 1
+        cache[2] = 2
+        cache[2]
+        timer.time = 2
+        cache[3] = 3
+        self.assertNotIn(1, cache)
+
+        # new items are never evicted before time has passed
+        cache[4] = 4
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+
+    def test_hyperbolic_delete(self):
+        cache = HyperbolicCache(maxsize=3, samples=3, choice=RoundRobin())
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        del cache[1]
+        cache[4] = 4
+        cache[2]
+        cache[5] = 5
+
+        self.assertEqual(len(cache), 3)
+        self.assertIn(2, cache)
+        self.assertIn(4, cache)
+        self.assertIn(5, cache)
+        self.assertNotIn(3, cache)
+
+    def test_hyperbolic_getsizeof(self):
+        cache = HyperbolicCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_hyperbolic_clear(self):
+        cache = HyperbolicCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+    def test_hyperbolic_default_choice(self):
+        cache = HyperbolicCache(maxsize=2)
+        self.assertEqual(5, cache.samples)
+        self.assertIs(cache.choice, random.choice)
@@ -31,6 +31,38 @@ class LFUCacheTest(unittest.TestCase, CacheTestMixin):
         self.assertEqual(cache[1], 1)
         self.assertEqual(cache[4], 4)
 
+    def test_lfu_lookup(self):
+        cache = LFUCache(maxsize=2)
+        cache.update({1: 1, 2: 2})
+        self.assertEqual(1, cache._lookup(1))
+        self.assertIsNone(cache._lookup(3))
+        cache[3] = 3
+        self.assertEqual({1, 3}, set(cache))
+
+    def test_lfu_tie(self):
+        cache = LFUCache(maxsize=3)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[3]
+        cache[1]
+        cache[2]
+
+        # evict least recently used among equally frequently used
+        cache[4] = 4
+        self.assertNotIn(3, cache)
+        cache[5] = 5
+        self.assertNotIn(4, cache)
+        cache[6] = 6
+        self.assertNotIn(5, cache)
+        cache[6]
+        cache[7] = 7
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(6, cache)
+        self.assertIn(7, cache)
+
     def test_lfu_getsizeof(self):
         cache = LFUCache(maxsize=3, getsizeof=lambda x: x)
 
@@ -88,3 +120,69 @@ class LFUCacheTest(unittest.TestCase, CacheTestMixin):
         self.assertIn(3, cache)
         self.assertIn(5, cache)
         self.assertNotIn(4, cache)
+
+    def test_lfu_halflife(self):
+        cache = LFUCache(maxsize=2, halflife=4)
+        self.assertEqual(4, cache.halflife)
+
+        cache[1] = 1
+        for _ in range(6):
+            cache[1]
+        cache[2] = 2
+        for _ in range(3):
+            cache[2]
+
+        # use counts are halved every four accesses
+        cache[3] = 3
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
+
+    def test_lfu_halflife_order(self):
+        cache = LFUCache(maxsize=4, halflife=1)
+
+        for n in range(4):
+            cache[n] = n
+            for _ in range(n):
+                cache[n]
+
+        cache[0]
+        cache[0]
+        cache[4] = 4
+        self.assertIn(0, cache)
+        self.assertNotIn(1, cache)
+
+    def test_lfu_halflife_merge(self):
+        cache = LFUCache(maxsize=100, halflife=4)
+
+        for n in range(10):
+            cache[n] = n
+            for _ in range(n):
+                cache[n]
+        for _ in range(40):
+            cache[10] = 10  # other use counts collapse to one
+        cache[0]
+
+        # equal-count buckets are merged when skipped
+        root = cache._LFUCache__root
+        counts = []
+        link = root.next
+        while link is not root:
+            counts.append(link.count)
+            link = link.next
+        self.assertEqual([1, 2, 3], counts)
+        self.assertEqual(list(range(1, 10)), list(root.next.keys))
+        self.assertEqual([0], list(root.next.next.keys))
+        self.assertEqual([10], list(root.prev.keys))
+
+    def test_lfu_no_halflife(self):
+        cache = LFUCache(maxsize=2)
+        self.assertIsNone(cache.halflife)
+
+        cache[1] = 1
+        for _ in range(100):
+            cache[1]
+        for n in range(2, 100):
+            cache[n] = n
+            cache[n]
+        self.assertIn(1, cache)
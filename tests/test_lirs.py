@@ -0,0 +1,147 @@
+import math
+import random
+import unittest
+
+from cachetools import LIRSCache
+
+from . import CacheTestMixin
+
+
+class LIRSCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = LIRSCache
+
+    def test_lirs(self):
+        cache = LIRSCache(maxsize=3)
+        self.assertEqual(0.01, cache.hirs)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3  # resident HIR
+        cache[4] = 4
+
+        self.assertEqual(len(cache), 3)
+        self.assertIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(4, cache)
+        self.assertNotIn(3, cache)
+
+        # non-resident HIR item with low inter-reference recency
+        cache[3] = 3
+        self.assertNotIn(4, cache)
+        cache[5] = 5
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertIn(5, cache)
+
+    def test_lirs_loop(self):
+        cache = LIRSCache(maxsize=100)
+
+        # a loop slightly larger than the cache
+        hits = 0
+        for _ in range(10):
+            for n in range(110):
+                if n in cache:
+                    hits += 1
+                else:
+                    cache[n] = n
+        self.assertGreater(hits, 800)
+
+    def test_lirs_loop_getsizeof(self):
+        cache = LIRSCache(maxsize=1000, getsizeof=lambda v: 10)
+
+        # the same loop with maxsize not being a number of items
+        hits = 0
+        for _ in range(10):
+            for n in range(110):
+                if n in cache:
+                    hits += 1
+                else:
+                    cache[n] = n
+        self.assertGreater(hits, 800)
+
+    def test_lirs_infinite(self):
+        cache = LIRSCache(maxsize=math.inf)
+
+        for n in range(200):
+            cache[n] = n
+        self.assertEqual(len(cache), 200)
+        self.assertEqual(2, len(cache._LIRSCache__queue))
+
+    def test_lirs_ghosts(self):
+        cache = LIRSCache(maxsize=10)
+
+        for n in range(1000):
+            cache[n] = n
+        self.assertEqual(len(cache), 10)
+        # non-resident HIR items are bounded
+        self.assertLessEqual(len(cache._LIRSCache__stack), 2 * len(cache))
+
+    def test_lirs_getsizeof(self):
+        cache = LIRSCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_lirs_delete(self):
+        cache = LIRSCache(maxsize=3)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        del cache[1]
+        del cache[3]
+        cache[4] = 4
+        cache[5] = 5
+        cache[6] = 6
+
+        self.assertEqual(len(cache), 3)
+        self.assertIn(2, cache)
+        self.assertIn(4, cache)
+        self.assertIn(6, cache)
+
+    def test_lirs_random(self):
+        def check(cache):
+            stack = cache._LIRSCache__stack
+            lir = cache._LIRSCache__lir
+            queue = cache._LIRSCache__queue
+            # the bottom of the stack is always a LIR item
+            if stack:
+                self.assertIn(next(iter(stack)), lir)
+            self.assertEqual(set(cache), lir | set(queue))
+            self.assertFalse(lir & set(queue))
+            self.assertLessEqual(lir, set(stack))
+
+        rng = random.Random(0)
+        for maxsize, getsizeof in ((2, None), (5, None), (20, lambda v: v)):
+            cache = LIRSCache(maxsize, getsizeof=getsizeof)
+            for _ in range(5000):
+                key = rng.randrange(10)
+                op = rng.randrange(5)
+                if op == 0:
+                    cache[key] = rng.randint(1, 5)
+                elif op == 1:
+                    cache.get(key)
+                elif op == 2:
+                    cache.pop(key, None)
+                elif op == 3 and key in cache:
+                    del cache[key]
+                elif op == 4 and cache:
+                    cache.popitem()
+                check(cache)
@@ -1,8 +1,8 @@
 import unittest
 
-from cachetools import LRUCache
+from cachetools import LRUCache, cached, cachedmethod, keys
 
-from . import CacheTestMixin
+from . import CacheTestMixin, CountedLock, CountedRWLock
 
 
 class LRUCacheTest(unittest.TestCase, CacheTestMixin):
@@ -87,3 +87,198 @@ class LRUCacheTest(unittest.TestCase, CacheTestMixin):
         self.assertIn(3, cache)
         self.assertIn(5, cache)
         self.assertNotIn(4, cache)
+
+    def test_lru_scan(self):
+        cache = LRUCache(maxsize=10, scan=5)
+        self.assertEqual(5, cache.scan)
+        self.assertEqual(0, cache.scans)
+
+        for n in range(10):
+            cache[n] = n
+            cache[n]
+        self.assertEqual(0, cache.scans)
+
+        # items added during a scan are discarded first
+        for n in range(100, 200):
+            cache[n] = n
+        self.assertEqual(1, cache.scans)
+        self.assertEqual(10, len(cache))
+        for n in range(5, 10):
+            self.assertIn(n, cache)
+
+        # a hit ends the scan
+        cache[9]
+        cache[200] = 200
+        cache[201] = 201
+        self.assertIn(200, cache)
+        self.assertIn(201, cache)
+        self.assertIn(9, cache)
+
+        for n in range(300, 400):
+            cache[n] = n
+        self.assertEqual(2, cache.scans)
+        self.assertIn(9, cache)
+
+        cache.clear()
+        self.assertEqual(0, cache.scans)
+
+    def test_lru_no_scan(self):
+        cache = LRUCache(maxsize=10)
+        self.assertIsNone(cache.scan)
+
+        for n in range(100):
+            cache[n] = n
+        self.assertEqual(0, cache.scans)
+        for n in range(90, 100):
+            self.assertIn(n, cache)
+
+    def test_lru_lazy(self):
+        cache = LRUCache(maxsize=4, lazy=0.5)
+        self.assertEqual(0.5, cache.lazy)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[4] = 4
+
+        # most recently used items are not moved on access
+        cache[4]
+        cache[3]
+        self.assertEqual([1, 2, 3, 4], list(cache._LRUCache__order))
+
+        # least recently used items are moved as usual
+        cache[1]
+        self.assertEqual([2, 3, 4, 1], list(cache._LRUCache__order))
+        cache[5] = 5
+        self.assertNotIn(2, cache)
+        self.assertIn(1, cache)
+
+    def test_lru_lazy_scan(self):
+        cache = LRUCache(maxsize=4, scan=1, lazy=1.0)
+
+        cache[1] = 1
+        cache[2] = 2
+        self.assertEqual([2, 1], list(cache._LRUCache__order))
+
+        # items added during a scan are moved on first access
+        cache[2]
+        self.assertEqual([1, 2], list(cache._LRUCache__order))
+
+    def test_lru_buffer(self):
+        cache = LRUCache(maxsize=3, buffer=4)
+        self.assertEqual(4, cache.buffer)
+        self.assertIsNone(LRUCache(maxsize=3).buffer)
+
+        cache.update({1: 1, 2: 2, 3: 3})
+
+        # items are not moved on access until the next update
+        self.assertEqual(1, cache[1])
+        self.assertEqual(2, cache._lookup(2))
+        self.assertEqual([1, 2, 3], list(cache._LRUCache__order))
+        cache[4] = 4
+        self.assertEqual([1, 2, 4], list(cache._LRUCache__order))
+
+        # buffered items are also moved before popitem()
+        cache[1]
+        self.assertEqual((2, 2), cache.popitem())
+
+        # keys of removed items are ignored
+        cache[4]
+        del cache[4]
+        cache[5] = 5
+        self.assertEqual([1, 5], list(cache._LRUCache__order))
+
+        cache[1]
+        cache.clear()
+        self.assertEqual(0, len(cache._LRUCache__buffer))
+
+    def test_lru_buffer_lossy(self):
+        cache = LRUCache(maxsize=3, buffer=1)
+        cache.update({1: 1, 2: 2, 3: 3})
+
+        # only the most recent access is kept
+        cache[1]
+        cache[2]
+        cache[4] = 4
+        self.assertEqual([3, 2, 4], list(cache._LRUCache__order))
+
+    def test_lru_buffer_lock(self):
+        lock = CountedLock()
+        cache = LRUCache(maxsize=2, buffer=16)
+        wrapper = cached(cache, lock=lock)(lambda x: x)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual(1, lock.count)  # hits do not acquire the lock
+
+        # buffered hits are applied when storing new items
+        self.assertEqual(wrapper(2), 2)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual(wrapper(3), 3)
+        self.assertEqual(3, lock.count)
+        self.assertEqual({keys.hashkey(1), keys.hashkey(3)}, set(cache))
+
+        # without a buffer, lookups modify the cache
+        lock = CountedRWLock()
+        cache = LRUCache(maxsize=2)
+        wrapper = cached(cache, lock=lock)(lambda x: x)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual(wrapper(1), 1)
+        self.assertEqual((0, 3), (lock.read_count, lock.count))
+
+    def test_lru_buffer_cachedmethod(self):
+        class Cached:
+            def __init__(self):
+                self.cache = LRUCache(maxsize=2, buffer=16)
+                self.lock = CountedRWLock()
+
+            @cachedmethod(lambda self: self.cache, lock=lambda self: self.lock)
+            def get(self, value):
+                return value
+
+            @cachedmethod(
+                lambda self: self.cache, lock=lambda self: self.lock, info=True
+            )
+            def get_info(self, value):
+                return value
+
+        # hits do not acquire the lock, as with @cached
+        obj = Cached()
+        self.assertEqual(obj.get(1), 1)
+        self.assertEqual(obj.get(1), 1)
+        self.assertEqual((0, 1), (obj.lock.read_count, obj.lock.count))
+
+        obj = Cached()
+        self.assertEqual(obj.get_info(1), 1)
+        self.assertEqual(obj.get_info(1), 1)
+        self.assertEqual((0, 1), (obj.lock.read_count, obj.lock.count))
+        self.assertEqual((1, 1, 2, 1), obj.get_info.cache_info())
+        obj.get_info.cache_clear()
+        self.assertEqual((0, 0, 2, 0), obj.get_info.cache_info())
+        self.assertEqual(obj.get_info(1), 1)
+        self.assertEqual(obj.get_info(1), 1)
+        self.assertEqual((1, 1, 2, 1), obj.get_info.cache_info())
+
+    def test_lru_lookup(self):
+        cache = LRUCache(maxsize=2)
+        cache.update({1: 1, 2: 2})
+        self.assertEqual(1, cache._lookup(1))
+        self.assertIsNone(cache._lookup(3))
+        cache[3] = 3
+        self.assertEqual({1, 3}, set(cache))
+
+    def test_lru_delitem_subclass(self):
+        class Cache(LRUCache):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.deleted = []
+
+            def __delitem__(self, key):
+                super().__delitem__(key)
+                self.deleted.append(key)
+
+        cache = Cache(maxsize=2)
+        cache.update({1: 1, 2: 2, 3: 3, 4: 4})
+        self.assertEqual(2, len(cache))
+        self.assertEqual(2, len(cache.deleted))
+        for key in cache.deleted:
+            self.assertNotIn(key, cache)
@@ -0,0 +1,124 @@
+import unittest
+
+from cachetools import LRUKCache
+
+from . import CacheTestMixin
+
+
+class LRUKCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = LRUKCache
+
+    def test_lruk(self):
+        cache = LRUKCache(maxsize=2)
+        self.assertEqual(2, cache.k)
+        self.assertIsNone(cache.timer)
+
+        cache[1] = 1
+        cache[1]
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(1, cache)
+        self.assertIn(3, cache)
+        self.assertNotIn(2, cache)
+
+        # items referenced less than k times are evicted first
+        cache[4] = 4
+        self.assertIn(1, cache)
+        self.assertIn(4, cache)
+        self.assertNotIn(3, cache)
+
+    def test_lruk_kth_reference(self):
+        cache = LRUKCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[1]
+        cache[2]
+        cache[2]
+        cache[1]  # 1 was referenced last, but its 2nd reference is older
+        cache[3] = 3
+
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
+
+    def test_lruk_history(self):
+        cache = LRUKCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        self.assertNotIn(1, cache)
+
+        # reference time of evicted item is retained
+        cache[1] = 1
+        self.assertNotIn(2, cache)
+        cache[4] = 4
+        self.assertIn(1, cache)
+        self.assertIn(4, cache)
+        self.assertNotIn(3, cache)
+
+    def test_lruk_history_bounded(self):
+        cache = LRUKCache(maxsize=10)
+
+        for n in range(1000):
+            cache[n] = n
+        self.assertEqual(len(cache), 10)
+        self.assertLessEqual(len(cache._LRUKCache__history), len(cache))
+
+    def test_lruk_timer(self):
+        class Timer:
+            def __init__(self):
+                self.time = 0
+
+            def __call__(self):
+                return self.time
+
+        timer = Timer()
+        cache = LRUKCache(maxsize=2, k=3, timer=timer)
+        self.assertEqual(3, cache.k)
+        self.assertIs(timer, cache.timer)
+
+        cache[1] = 1
+        timer.time = 1
+        cache[1]
+        cache[1]
+        timer.time = 2
+        cache[2] = 2
+        cache[2]
+        cache[2]
+        timer.time = 3
+        cache[3] = 3
+        self.assertNotIn(1, cache)
+        cache[4] = 4
+        self.assertNotIn(3, cache)
+        self.assertIn(2, cache)
+
+    def test_lruk_heap_cleanup(self):
+        cache = LRUKCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        for _ in range(100):
+            cache[1]
+            cache[2]
+        self.assertLessEqual(len(cache._LRUKCache__order), 2 * len(cache) + 1)
+
+    def test_lruk_clear(self):
+        cache = LRUKCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+        # verify evicted keys are forgotten after clear
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        self.assertNotIn(1, cache)
@@ -0,0 +1,81 @@
+import threading
+import unittest
+from os import environ
+
+from cachetools import RWLock
+
+THREADING_TESTS = environ.get("THREADING_TESTS", False)
+
+
+class RWLockTest(unittest.TestCase):
+    def test_write(self):
+        lock = RWLock()
+        self.assertTrue(lock.acquire())
+        lock.release()
+        with lock:
+            pass
+        with self.assertRaises(RuntimeError):
+            lock.release()
+
+    def test_read(self):
+        lock = RWLock()
+        self.assertTrue(lock.acquire_read())
+        self.assertTrue(lock.acquire_read())
+        lock.release_read()
+        lock.release_read()
+        with lock.read:
+            pass
+        with self.assertRaises(RuntimeError):
+            lock.release_read()
+
+    @unittest.skipUnless(THREADING_TESTS, "THREADING_TESTS not set")
+    def test_concurrent_readers(self):
+        lock = RWLock()
+        barrier = threading.Barrier(2, timeout=10)
+
+        def read():
+            with lock.read:
+                barrier.wait()  # both readers hold the lock
+
+        threads = [threading.Thread(target=read) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertFalse(barrier.broken)
+
+    @unittest.skipUnless(THREADING_TESTS, "THREADING_TESTS not set")
+    def test_exclusive_writer(self):
+        lock = RWLock()
+        events = []
+
+        def write():
+            with lock:
+                events.append("write")
+
+        def read():
+            with lock.read:
+                events.append("read")
+
+        lock.acquire_read()
+        writer = threading.Thread(target=write)
+        writer.start()
+        writer.join(0.1)
+        self.assertEqual([], events)
+
+        # new readers wait for the pending writer
+        reader = threading.Thread(target=read)
+        reader.start()
+        reader.join(0.1)
+        self.assertTrue(reader.is_alive())
+
+        lock.release_read()
+        writer.join(10)
+        reader.join(10)
+        self.assertFalse(writer.is_alive())
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(["write", "read"], events)
+
+        # no thread holds the lock
+        self.assertTrue(lock.acquire())
+        lock.release()
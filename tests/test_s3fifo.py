@@ -0,0 +1,109 @@
+import unittest
+
+from cachetools import S3FIFOCache
+
+from . import CacheTestMixin
+
+
+class S3FIFOCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = S3FIFOCache
+
+    def test_s3fifo(self):
+        cache = S3FIFOCache(maxsize=2)
+        self.assertEqual(0.1, cache.small)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[2], 2)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+
+        cache[4] = 4
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[4], 4)
+        self.assertIn(3, cache)
+        self.assertNotIn(2, cache)
+
+    def test_s3fifo_ghost(self):
+        cache = S3FIFOCache(maxsize=4, small=0.25)
+
+        for n in range(6):
+            cache[n] = n
+        self.assertNotIn(0, cache)
+
+        # recently evicted keys are added to the main queue
+        cache[0] = 0
+        for n in range(6, 10):
+            cache[n] = n
+        self.assertIn(0, cache)
+
+    def test_s3fifo_scan(self):
+        cache = S3FIFOCache(maxsize=10)
+
+        for n in range(5):
+            cache[n] = n
+            cache[n]
+
+        # a scan of items seen only once does not flush the hot set
+        for n in range(100, 200):
+            cache[n] = n
+            cache[n % 5]
+        for n in range(5):
+            self.assertIn(n, cache)
+
+    def test_s3fifo_getsizeof_small(self):
+        for maxsize, getsizeof in ((10, None), (100, lambda v: 10)):
+            cache = S3FIFOCache(maxsize=maxsize, getsizeof=getsizeof)
+            for n in range(10):
+                cache[n] = n
+            for n in range(10):
+                cache[n]
+            for n in range(100, 130):
+                cache[n] = n
+            # small queue is limited to 10% of maxsize
+            self.assertEqual(1, len(cache._S3FIFOCache__smallq))
+            self.assertEqual(list(range(1, 10)), sorted(n for n in cache if n < 10))
+
+    def test_s3fifo_getsizeof(self):
+        cache = S3FIFOCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_s3fifo_clear(self):
+        cache = S3FIFOCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+        # verify evicted keys are forgotten after clear
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(3, cache)
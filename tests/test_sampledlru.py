@@ -0,0 +1,128 @@
+import random
+import unittest
+
+from cachetools import SampledLRUCache
+
+from . import CacheTestMixin
+
+
+class RoundRobin:
+    def __init__(self):
+        self.index = 0
+
+    def __call__(self, seq):
+        self.index += 1
+        return seq[self.index % len(seq)]
+
+
+class SampledLRUCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = SampledLRUCache
+
+    def test_sampledlru(self):
+        choice = RoundRobin()
+        cache = SampledLRUCache(maxsize=2, samples=2, choice=choice)
+        self.assertEqual(2, cache.samples)
+        self.assertIs(choice, cache.choice)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[2], 2)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+
+        cache[2]
+        cache[4] = 4
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[2], 2)
+        self.assertEqual(cache[4], 4)
+        self.assertNotIn(3, cache)
+
+        cache[5] = 5
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[4], 4)
+        self.assertEqual(cache[5], 5)
+        self.assertNotIn(2, cache)
+
+    def test_sampledlru_samples(self):
+        cache = SampledLRUCache(maxsize=10, samples=1, choice=min)
+
+        for n in range(10):
+            cache[n] = n
+        cache[0]
+
+        # only the sampled item is considered for eviction
+        cache[10] = 10
+        self.assertNotIn(0, cache)
+        self.assertIn(1, cache)
+
+    def test_sampledlru_update_existing(self):
+        cache = SampledLRUCache(maxsize=3, samples=3, choice=RoundRobin())
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[1] = "updated"
+        cache[4] = 4
+
+        self.assertEqual(cache[1], "updated")
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+        self.assertNotIn(2, cache)
+
+    def test_sampledlru_delete(self):
+        cache = SampledLRUCache(maxsize=3, samples=3, choice=RoundRobin())
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        del cache[1]
+        cache[4] = 4
+        cache[2]
+        cache[5] = 5
+
+        self.assertEqual(len(cache), 3)
+        self.assertIn(2, cache)
+        self.assertIn(4, cache)
+        self.assertIn(5, cache)
+        self.assertNotIn(3, cache)
+
+    def test_sampledlru_getsizeof(self):
+        cache = SampledLRUCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_sampledlru_clear(self):
+        cache = SampledLRUCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+        self.assertEqual(0, len(cache._SampledLRUCache__ticks))
+
+    def test_sampledlru_default_choice(self):
+        cache = SampledLRUCache(maxsize=2)
+        self.assertEqual(5, cache.samples)
+        self.assertIs(cache.choice, random.choice)
@@ -0,0 +1,123 @@
+import math
+import unittest
+
+from cachetools import SetAssociativeCache
+
+from . import CacheTestMixin
+
+
+class SetAssociativeCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = SetAssociativeCache
+
+    def test_setassociative(self):
+        cache = SetAssociativeCache(maxsize=4, ways=2)
+        self.assertEqual(2, cache.ways)
+
+        # integers hash to themselves, so even keys share a set
+        cache[0] = 0
+        cache[1] = 1
+        cache[2] = 2
+        cache[4] = 4
+
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn(0, cache)
+        self.assertIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(4, cache)
+
+        # least recently used item of the set is evicted
+        cache[2]
+        cache[6] = 6
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn(4, cache)
+        self.assertIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(6, cache)
+
+    def test_setassociative_full(self):
+        cache = SetAssociativeCache(maxsize=16, ways=8)
+        for n in range(16):
+            cache[n] = n
+
+        # only the least recently used item of the second set is evicted
+        cache[17] = 17
+        self.assertEqual(len(cache), 16)
+        self.assertEqual(set(range(16)) - {1} | {17}, set(cache))
+
+    def test_setassociative_too_large(self):
+        cache = SetAssociativeCache(maxsize=4, ways=1, getsizeof=lambda x: x)
+        cache[0] = 1
+
+        # nothing is evicted for a value that is too large
+        with self.assertRaises(ValueError):
+            cache[4] = 100
+        self.assertEqual({0: 1}, dict(cache))
+
+    def test_setassociative_popitem(self):
+        cache = SetAssociativeCache(maxsize=4, ways=2)
+
+        cache[0] = 0
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[0]
+
+        # sets are evicted from in turn
+        self.assertEqual((2, 2), cache.popitem())
+        self.assertEqual((1, 1), cache.popitem())
+        self.assertEqual((0, 0), cache.popitem())
+        self.assertEqual((3, 3), cache.popitem())
+        with self.assertRaises(KeyError):
+            cache.popitem()
+
+    def test_setassociative_update_existing(self):
+        cache = SetAssociativeCache(maxsize=4, ways=2)
+
+        cache[0] = 0
+        cache[2] = 2
+        cache[0] = "updated"
+        cache[4] = 4
+
+        self.assertEqual(cache[0], "updated")
+        self.assertIn(4, cache)
+        self.assertNotIn(2, cache)
+
+    def test_setassociative_unbounded(self):
+        cache = SetAssociativeCache(maxsize=math.inf, ways=2)
+
+        for n in range(100):
+            cache[n] = n
+        self.assertEqual(len(cache), 100)
+
+    def test_setassociative_getsizeof(self):
+        cache = SetAssociativeCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_setassociative_clear(self):
+        cache = SetAssociativeCache(maxsize=4, ways=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+        self.assertEqual({}, cache._SetAssociativeCache__sets)
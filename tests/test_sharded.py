@@ -0,0 +1,120 @@
+import math
+import threading
+import unittest
+
+from cachetools import FIFOCache, LRUCache, ShardedCache
+
+
+class ShardedCacheTest(unittest.TestCase):
+    def test_sharded(self):
+        cache = ShardedCache(maxsize=10, shards=4)
+        self.assertEqual(4, len(cache.shards))
+        self.assertEqual(4, len(cache.locks))
+        self.assertEqual([3, 3, 2, 2], [s.maxsize for s in cache.shards])
+        self.assertEqual(10, cache.maxsize)
+        self.assertEqual(0, cache.currsize)
+        self.assertTrue(repr(cache).startswith("ShardedCache("))
+
+        cache.update({1: 1, 2: 2, 5: 5})
+        self.assertEqual(3, len(cache))
+        self.assertEqual(3, cache.currsize)
+        self.assertEqual({1, 2, 5}, set(cache))
+        self.assertEqual(1, cache[1])
+        self.assertEqual(5, cache.get(5))
+        self.assertIsNone(cache.get(3))
+        self.assertNotIn(3, cache)
+        with self.assertRaises(KeyError):
+            cache[3]
+
+        # integers hash to themselves
+        self.assertEqual({1, 5}, set(cache.shards[1]))
+        self.assertEqual({2}, set(cache.shards[2]))
+
+        self.assertEqual(2, cache.pop(2))
+        self.assertEqual(None, cache.pop(2, None))
+        with self.assertRaises(KeyError):
+            cache.pop(2)
+        self.assertEqual(3, cache.setdefault(3, 3))
+        self.assertEqual(3, cache.setdefault(3, 4))
+        del cache[3]
+        self.assertNotIn(3, cache)
+        with self.assertRaises(KeyError):
+            del cache[3]
+        self.assertEqual(2, len(cache))
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+    def test_sharded_evict(self):
+        cache = ShardedCache(maxsize=4, shards=2)
+
+        # only the shard a key belongs to is affected
+        cache.update({0: 0, 2: 2, 4: 4, 1: 1})
+        self.assertEqual({2, 4, 1}, set(cache))
+        cache[2]
+        cache[6] = 6
+        self.assertEqual({2, 6, 1}, set(cache))
+
+    def test_sharded_factory(self):
+        cache = ShardedCache(maxsize=4, shards=2, factory=FIFOCache)
+        for shard in cache.shards:
+            self.assertIsInstance(shard, FIFOCache)
+        cache.update({0: 0, 2: 2})
+        cache[0]
+        cache[4] = 4
+        self.assertEqual({2, 4}, set(cache))
+
+    def test_sharded_popitem(self):
+        cache = ShardedCache(maxsize=4, shards=2)
+        cache.update({1: 1, 2: 2})
+        self.assertEqual((2, 2), cache.popitem())
+        self.assertEqual((1, 1), cache.popitem())
+        with self.assertRaises(KeyError) as cm:
+            cache.popitem()
+        self.assertEqual(("ShardedCache is empty",), cm.exception.args)
+
+    def test_sharded_small(self):
+        cache = ShardedCache(maxsize=4)
+        self.assertEqual([1, 1, 1, 1], [s.maxsize for s in cache.shards])
+        self.assertEqual(4, len(cache.locks))
+        cache.update({i: i for i in range(4)})
+        self.assertEqual(4, len(cache))
+
+        cache = ShardedCache(maxsize=0)
+        self.assertEqual([0], [s.maxsize for s in cache.shards])
+
+        with self.assertRaises(ValueError):
+            ShardedCache(maxsize=4, shards=0)
+
+    def test_sharded_infinite(self):
+        cache = ShardedCache(maxsize=math.inf, shards=2)
+        self.assertEqual(math.inf, cache.maxsize)
+        cache.update({i: i for i in range(100)})
+        self.assertEqual(100, len(cache))
+
+    def test_sharded_lookup(self):
+        cache = ShardedCache(maxsize=4, shards=2)
+        cache.update({0: 0, 2: 2})
+        self.assertEqual(0, cache._lookup(0))
+        self.assertIsNone(cache._lookup(1))
+        cache[4] = 4
+        self.assertEqual({0, 4}, set(cache))
+
+    def test_sharded_threads(self):
+        cache = ShardedCache(maxsize=100, shards=4)
+
+        def run(n):
+            for i in range(1000):
+                cache[(n, i % 50)] = i
+                cache.get((n, i % 25))
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLessEqual(len(cache), 100)
+        self.assertEqual(len(cache), sum(len(shard) for shard in cache.shards))
+        for shard in cache.shards:
+            self.assertIsInstance(shard, LRUCache)
@@ -0,0 +1,109 @@
+import unittest
+
+from cachetools import SieveCache
+
+from . import CacheTestMixin
+
+
+class SieveCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = SieveCache
+
+    def test_sieve(self):
+        cache = SieveCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[2], 2)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+
+        cache[4] = 4  # all visited, evict after full sweep
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[4], 4)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+
+    def test_sieve_hand(self):
+        cache = SieveCache(maxsize=4)
+
+        for n in range(4):
+            cache[n] = n
+        cache[0]
+        cache[2]
+
+        cache[4] = 4
+        self.assertIn(0, cache)
+        self.assertNotIn(1, cache)
+
+        # hand keeps its position instead of starting over
+        cache[0]
+        cache[5] = 5
+        self.assertIn(0, cache)
+        self.assertIn(2, cache)
+        self.assertNotIn(3, cache)
+
+        cache[6] = 6
+        self.assertNotIn(4, cache)
+        self.assertIn(0, cache)
+        self.assertIn(2, cache)
+
+        cache[7] = 7
+        self.assertNotIn(5, cache)
+        self.assertIn(2, cache)
+
+    def test_sieve_delete_hand(self):
+        cache = SieveCache(maxsize=3)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[1]
+        cache[4] = 4  # hand now at 3
+        self.assertNotIn(2, cache)
+
+        del cache[3]
+        cache[5] = 5
+        cache[6] = 6
+        self.assertNotIn(4, cache)
+        self.assertIn(1, cache)
+        self.assertIn(5, cache)
+        self.assertIn(6, cache)
+
+    def test_sieve_popitem(self):
+        class LoggingCache(SieveCache):
+            def __getitem__(self, key):
+                self.keys.append(key)
+                return super().__getitem__(key)
+
+        cache = LoggingCache(maxsize=2)
+        cache.keys = []
+        cache.update({1: 1, 2: 2})
+        self.assertEqual((1, 1), cache.popitem())
+        cache[3] = 3
+        cache[4] = 4
+        self.assertEqual([], cache.keys)
+
+    def test_sieve_getsizeof(self):
+        cache = SieveCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
@@ -0,0 +1,119 @@
+import unittest
+
+from cachetools import SLRUCache
+
+from . import CacheTestMixin
+
+
+class SLRUCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = SLRUCache
+
+    def test_slru(self):
+        cache = SLRUCache(maxsize=3)
+        self.assertEqual(0.8, cache.protected)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[3] = 3
+        cache[1]  # promote to protected segment
+        cache[4] = 4
+
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache[1], 1)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertIn(4, cache)
+
+        cache[5] = 5
+        self.assertEqual(len(cache), 3)
+        self.assertIn(1, cache)
+        self.assertNotIn(3, cache)
+        self.assertIn(4, cache)
+        self.assertIn(5, cache)
+
+    def test_slru_scan(self):
+        cache = SLRUCache(maxsize=10, protected=0.5)
+
+        for n in range(5):
+            cache[n] = n
+            cache[n]
+
+        # a scan of items seen only once does not flush the hot set
+        for n in range(100, 200):
+            cache[n] = n
+        for n in range(5):
+            self.assertIn(n, cache)
+
+    def test_slru_demote(self):
+        cache = SLRUCache(maxsize=4, protected=0.5)
+
+        for n in range(4):
+            cache[n] = n
+        cache[0]
+        cache[1]
+        cache[2]  # demotes 0 to probationary segment
+
+        cache[4] = 4
+        self.assertNotIn(3, cache)
+        cache[5] = 5
+        self.assertNotIn(0, cache)
+        self.assertIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertIn(4, cache)
+        self.assertIn(5, cache)
+
+    def test_slru_getsizeof(self):
+        cache = SLRUCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_slru_getsizeof_protected(self):
+        cache = SLRUCache(maxsize=100, getsizeof=lambda v: v)
+        for i in range(10):
+            cache[i] = 10
+        for i in range(10):
+            cache[i]
+
+        # protected segment is limited to 80% of maxsize
+        protection = cache._SLRUCache__protection
+        self.assertEqual(list(range(2, 10)), list(protection))
+        self.assertEqual(80, cache._SLRUCache__protsize)
+
+        # growing a protected value demotes more items
+        cache[9] = 30
+        self.assertEqual(list(range(4, 10)), list(protection))
+        self.assertEqual(80, cache._SLRUCache__protsize)
+
+        del cache[9]
+        self.assertEqual(50, cache._SLRUCache__protsize)
+        cache.clear()
+        self.assertEqual(0, cache._SLRUCache__protsize)
+
+    def test_slru_update_existing(self):
+        cache = SLRUCache(maxsize=2)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache[1] = "updated"
+        cache[3] = 3
+
+        self.assertEqual(cache[1], "updated")
+        self.assertIn(3, cache)
+        self.assertNotIn(2, cache)
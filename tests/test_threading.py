@@ -60,3 +60,23 @@ class ThreadingTest(unittest.TestCase):
         info = self.meth.cache_info()
         self.assertEqual(info.hits, self.NTHREADS - 1)
         self.assertEqual(info.misses, 1)
+
+    def test_cached_lockfree_info(self):
+        @cached(cache=LRUCache(100, buffer=16), lock=threading.Lock(), info=True)
+        def square(n):
+            return n * n
+
+        def run():
+            for n in range(10000):
+                self.assertEqual(square(n % 100), (n % 100) ** 2)
+
+        threads = [threading.Thread(target=run) for i in range(0, self.NTHREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # hits counted without holding the lock are not lost
+        info = square.cache_info()
+        self.assertEqual(info.hits + info.misses, 10000 * self.NTHREADS)
+        self.assertGreaterEqual(info.misses, 100)
@@ -0,0 +1,132 @@
+import math
+import unittest
+
+from cachetools import TinyLFUCache
+
+from . import CacheTestMixin
+
+
+class TinyLFUCacheTest(unittest.TestCase, CacheTestMixin):
+    Cache = TinyLFUCache
+
+    def test_tinylfu(self):
+        cache = TinyLFUCache(maxsize=2)
+        self.assertEqual(0.01, cache.window)
+
+        cache[1] = 1
+        cache[1]
+        cache[2] = 2
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(2, cache)
+
+        # candidate is not admitted unless used more frequently
+        cache[4] = 4
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[4], 4)
+        self.assertNotIn(3, cache)
+
+    def test_tinylfu_admission(self):
+        cache = TinyLFUCache(maxsize=10, window=0.1)
+
+        for n in range(9):
+            cache[n] = n
+            cache[n]
+
+        # a scan of one-hit wonders does not flush the hot set
+        for n in range(100, 1000):
+            cache[n] = n
+            self.assertEqual(cache[n % 9], n % 9)
+        self.assertEqual(len(cache), 10)
+
+        # frequently used items are admitted eventually
+        for _ in range(200):
+            try:
+                cache[1000]
+            except KeyError:
+                cache[1000] = 1000
+        cache[1001] = 1001
+        self.assertIn(1000, cache)
+
+    def test_tinylfu_aging(self):
+        sketch = TinyLFUCache._Sketch(16)
+
+        for _ in range(5):
+            sketch.increment("a")
+        self.assertEqual(5, sketch.frequency("a"))
+        self.assertEqual(0, sketch.frequency("b"))
+
+        sketch.reset()
+        self.assertEqual(2, sketch.frequency("a"))
+
+        for _ in range(200):
+            sketch.increment("b")
+        self.assertEqual(1, sketch.frequency("a"))
+        self.assertGreater(sketch.frequency("b"), 1)
+
+    def test_tinylfu_getsizeof(self):
+        cache = TinyLFUCache(maxsize=3, getsizeof=lambda x: x)
+
+        cache[1] = 1
+        cache[2] = 2
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache[1], 1)
+        self.assertEqual(cache[2], 2)
+
+        cache[3] = 3
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+        self.assertNotIn(1, cache)
+        self.assertNotIn(2, cache)
+
+        with self.assertRaises(ValueError):
+            cache[4] = 4
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache[3], 3)
+
+    def test_tinylfu_sketch_size(self):
+        def width(cache):
+            return cache._TinyLFUCache__sketch.mask + 1
+
+        self.assertEqual(1024, width(TinyLFUCache(maxsize=1000)))
+
+        # maxsize is not a number of items, so the sketch grows as needed
+        for cache in (
+            TinyLFUCache(maxsize=10**8, getsizeof=len),
+            TinyLFUCache(maxsize=math.inf),
+        ):
+            self.assertEqual(16, width(cache))
+            for i in range(100):
+                cache[str(i)] = str(i)
+            self.assertEqual(100, len(cache))
+            self.assertGreaterEqual(width(cache), 100)
+            self.assertLessEqual(width(cache), 256)
+
+    def test_tinylfu_clear(self):
+        cache = TinyLFUCache(maxsize=2)
+
+        cache[1] = 1
+        cache[1]
+        cache[1]
+        cache[2] = 2
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.currsize)
+
+        # verify frequency tracking is reset after clear
+        cache[3] = 3
+        cache[4] = 4
+        cache[3]
+        cache[5] = 5
+
+        self.assertEqual(2, len(cache))
+        self.assertIn(3, cache)
+        self.assertIn(5, cache)
+        self.assertNotIn(4, cache)
@@ -218,6 +218,32 @@ class TLRUCacheTest(unittest.TestCase, CacheTestMixin):
         cache.clear()
         self.assertEqual(0, len(cache))
 
+    def test_ttu_many(self):
+        cache = TLRUCache(maxsize=3, ttu=lambda k, v, t: t + 3, timer=Timer(auto=True))
+
+        # time is frozen for the whole batch
+        cache.set_many({1: 1, 2: 2, 3: 3})
+        self.assertEqual({1: 1, 2: 2, 3: 3}, cache.get_many([1, 2, 3]))
+        self.assertEqual(2, cache.delete_many([1, 2]))
+        self.assertEqual(3, cache.timer.time)
+
+        # expired items are removed once
+        self.assertEqual({}, cache.get_many([3]))
+        self.assertEqual(0, cache.currsize)
+        self.assertEqual(0, cache.delete_many([3]))
+
+    def test_ttu_lookup(self):
+        cache = TLRUCache(maxsize=2, ttu=lambda k, v, t: t + 2, timer=Timer())
+        cache.update({1: 1, 2: 2})
+        self.assertEqual(1, cache._lookup(1))
+        cache[3] = 3
+        self.assertEqual({1, 3}, set(cache))
+
+        cache.timer.tick()
+        cache.timer.tick()
+        self.assertIsNone(cache._lookup(1))
+        self.assertIsNone(cache._lookup(3))
+
     def test_ttu_tuple_key(self):
         cache = TLRUCache(maxsize=1, ttu=lambda k, v, t: t + 1, timer=Timer())
 
@@ -327,3 +353,28 @@ class TLRUCacheTest(unittest.TestCase, CacheTestMixin):
         cache.timer.tick()
         cache.timer.tick()  # past TTL
         self.assertNotIn(42, cache)
+
+    def test_ttu_on_evict(self):
+        batches = []
+        cache = TLRUCache(
+            maxsize=3,
+            ttu=lambda k, v, t: t + 2,
+            timer=Timer(),
+            on_evict=batches.append,
+        )
+
+        cache[1] = 1
+        cache[2] = 2
+        cache.timer.tick()
+        cache[3] = 3
+        self.assertEqual([], batches)
+
+        # expired items are delivered in one batch
+        cache.timer.tick()
+        self.assertEqual(1, len(cache))
+        self.assertEqual([[(1, 1, "expired"), (2, 2, "expired")]], batches)
+        batches.clear()
+
+        cache.timer.tick()
+        cache[4] = 4
+        self.assertEqual([[(3, 3, "expired")]], batches)
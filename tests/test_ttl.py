@@ -191,6 +191,32 @@ class TTLCacheTest(unittest.TestCase, CacheTestMixin):
         cache.clear()
         self.assertEqual(0, len(cache))
 
+    def test_ttl_many(self):
+        cache = TTLCache(maxsize=3, ttl=3, timer=Timer(auto=True))
+
+        # time is frozen for the whole batch
+        cache.set_many({1: 1, 2: 2, 3: 3})
+        self.assertEqual({1: 1, 2: 2, 3: 3}, cache.get_many([1, 2, 3]))
+        self.assertEqual(2, cache.delete_many([1, 2]))
+        self.assertEqual(3, cache.timer.time)
+
+        # expired items are removed once
+        self.assertEqual({}, cache.get_many([3]))
+        self.assertEqual(0, cache.currsize)
+        self.assertEqual(0, cache.delete_many([3]))
+
+    def test_ttl_lookup(self):
+        cache = TTLCache(maxsize=2, ttl=2, timer=Timer())
+        cache.update({1: 1, 2: 2})
+        self.assertEqual(1, cache._lookup(1))
+        cache[3] = 3
+        self.assertEqual({1, 3}, set(cache))
+
+        cache.timer.tick()
+        cache.timer.tick()
+        self.assertIsNone(cache._lookup(1))
+        self.assertIsNone(cache._lookup(3))
+
     def test_ttl_tuple_key(self):
         cache = TTLCache(maxsize=1, ttl=1, timer=Timer())
         self.assertEqual(1, cache.ttl)
@@ -243,3 +269,40 @@ class TTLCacheTest(unittest.TestCase, CacheTestMixin):
         cache.timer.tick()
         cache.timer.tick()  # past TTL
         self.assertNotIn(42, cache)
+
+    def test_ttl_delitem_subclass(self):
+        class Cache(TTLTestCache):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.deleted = []
+
+            def __delitem__(self, key):
+                super().__delitem__(key)
+                self.deleted.append(key)
+
+        cache = Cache(maxsize=2)
+        cache.update({1: 1, 2: 2, 3: 3, 4: 4})
+        self.assertEqual(2, len(cache))
+        self.assertEqual(2, len(cache.deleted))
+        for key in cache.deleted:
+            self.assertNotIn(key, cache)
+
+    def test_ttl_on_evict(self):
+        batches = []
+        cache = TTLCache(maxsize=3, ttl=2, timer=Timer(), on_evict=batches.append)
+
+        cache[1] = 1
+        cache[2] = 2
+        cache.timer.tick()
+        cache[3] = 3
+        self.assertEqual([], batches)
+
+        # expired items are delivered in one batch
+        cache.timer.tick()
+        self.assertEqual(1, len(cache))
+        self.assertEqual([[(1, 1, "expired"), (2, 2, "expired")]], batches)
+        batches.clear()
+
+        cache.timer.tick()
+        cache[4] = 4
+        self.assertEqual([[(3, 3, "expired")]], batches)